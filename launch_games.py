@@ -15,6 +15,9 @@ import sys
 import time
 import traceback
 
+# Directory containing the launcher and the game modules
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 
 def clear_screen():
     """
@@ -122,9 +125,8 @@ def main():
         return
 
     try:
-        # Add the current directory to the Python path
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        sys.path.insert(0, current_dir)
+        # Add the launcher's directory to the Python path
+        sys.path.insert(0, SCRIPT_DIR)
 
         # Import the game selector
         try:
@@ -142,7 +144,7 @@ def main():
         except ImportError as e:
             print(f"Error: Could not import the game_selector module. {e}")
             print(
-                f"Make sure the file 'game_selector.py' exists in: {current_dir}"
+                f"Make sure the file 'game_selector.py' exists in: {SCRIPT_DIR}"
             )
             print("\nPossible solutions:")
             print(
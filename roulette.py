@@ -24,14 +24,22 @@ Quality of Life Features:
 import random
 import time
 import sys
+try:
+    # NumPy is optional; it only speeds up batch simulation helpers
+    import numpy as np
+except ImportError:
+    np = None
 try:
     # Try to import from the utils_terminal module in the current directory
     from utils_terminal import (
         colorText, 
+        cprint,
+        normalizeInput,
         processCommand, 
         processQuickBet,
         getStreakData,
         saveStreakData,
+        flushStreakData,
         getWinStreakReward
     )
 except ImportError:
@@ -39,10 +47,13 @@ except ImportError:
     try:
         from terminal_games.utils_terminal import (
             colorText, 
+            cprint,
+            normalizeInput,
             processCommand, 
             processQuickBet,
             getStreakData,
             saveStreakData,
+            flushStreakData,
             getWinStreakReward
         )
     except ImportError:
@@ -51,13 +62,21 @@ except ImportError:
             """Fallback implementation of colorText function"""
             return text
             
+        def cprint(text, color):
+            """Fallback implementation of cprint function"""
+            print(text)
+            
+        def normalizeInput(text):
+            """Fallback implementation of normalizeInput function"""
+            return text.lower()
+            
         def processCommand(command, game_name):
             """Fallback implementation of processCommand function"""
             return (False, "")
             
-        def processQuickBet(command):
+        def processQuickBet(command, current_balance=None):
             """Fallback implementation of processQuickBet function"""
-            return (False, {})
+            return (False, None)
             
         def getStreakData(game_name):
             """Fallback implementation of getStreakData function"""
@@ -67,6 +86,10 @@ except ImportError:
             """Fallback implementation of saveStreakData function"""
             pass
             
+        def flushStreakData():
+            """Fallback implementation of flushStreakData function"""
+            pass
+            
         def getWinStreakReward(streak, game_name):
             """Fallback implementation of getWinStreakReward function"""
             return (0, "")
@@ -91,6 +114,58 @@ BET_TYPES = {
     'high': {'name': 'High (19-36)', 'description': 'Bet on numbers 19-36', 'payout': 1}
 }
 
+# Total amount returned per Rock on a winning bet (the payout plus the original bet)
+_TOTAL_RETURN = {bet_type: info['payout'] + 1 for bet_type, info in BET_TYPES.items()}
+
+# Rules text shown at the start of the game, written in a single call
+_RULES_TEXT = (
+    "\n" + "=" * 70 + "\n"
+    + " " * 25 + "ROULETTE RULES\n"
+    + "=" * 70 + "\n"
+    + """
+Roulette is a game where you bet on where a ball will land on a spinning wheel.
+The wheel has numbers 0-36, with 0 being green, and the rest being red or black.
+
+Betting Options:
+- Inside Bets (Higher Payout):
+  • Straight Up: Bet on a single number (pays 35:1)
+  • Split: Bet on two adjacent numbers (pays 17:1)
+  • Street: Bet on three numbers in a row (pays 11:1)
+  • Corner: Bet on four numbers that form a square (pays 8:1)
+
+- Outside Bets (Lower Payout):
+  • Red/Black: Bet on all red or all black numbers (pays 1:1)
+  • Odd/Even: Bet on all odd or all even numbers (pays 1:1)
+  • Low/High: Bet on numbers 1-18 or 19-36 (pays 1:1)
+
+Note: If the ball lands on 0 (green), all outside bets lose.
+You can place multiple bets in a single round.
+
+For example, if you bet 10 Rocks on Straight Up and win, you'd get 360 Rocks back:
+  • Your original 10 Rocks + (10 Rocks × 35) = 360 Rocks
+
+Type 'quit' or 'q' at any prompt to exit the game.
+"""
+    + "-" * 70 + "\n"
+)
+
+# Rocks given to a player who runs out, and the message announcing them.
+# Only the text is prebuilt: colors can be toggled mid-game with color:switch.
+EMERGENCY_ROCKS = 50
+_EMERGENCY_ROCKS_TEXT = f"Here's an emergency {EMERGENCY_ROCKS} Rocks to keep playing."
+
+# Accepted answers at the input prompts
+_QUIT_TOKENS = frozenset({'quit', 'q', 'exit'})
+_YES_TOKENS = frozenset({'y', 'yes'})
+_NO_TOKENS = frozenset({'n', 'no'})
+_LEAVE_TOKENS = _NO_TOKENS | _QUIT_TOKENS
+
+# Valid smallest numbers for street and corner bets
+_STREET_STARTS = frozenset({1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34})
+_CORNER_STARTS = frozenset({1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22, 23, 25, 26, 28, 29, 31, 32, 34})
+_STREET_STARTS_TEXT = "Valid starting numbers: " + ", ".join(map(str, sorted(_STREET_STARTS)))
+_CORNER_STARTS_TEXT = "Valid starting numbers: " + ", ".join(map(str, sorted(_CORNER_STARTS)))
+
 def get_color(number):
     """
     Determine the color of a roulette number.
@@ -121,12 +196,29 @@ def spin_wheel():
         print(f"{i}...")
         time.sleep(0.5)
     
-    winning_number = random.choice(WHEEL_NUMBERS)
+    winning_number = random.randrange(37)
     color = get_color(winning_number)
     
     print(f"\nThe ball lands on: {winning_number} {color.upper()}")
     return winning_number
 
+def spin_many(n):
+    """
+    Spin the roulette wheel many times without any display or delay.
+    
+    This is intended for simulations, where spinning one number at a time
+    would be far too slow. NumPy is used when it is installed.
+    
+    Args:
+        n (int): The number of spins to generate
+        
+    Returns:
+        numpy.ndarray or list: The winning numbers (0-36) of each spin
+    """
+    if np is not None:
+        return np.random.randint(0, 37, size=n, dtype=np.int8)
+    return [random.randrange(37) for _ in range(n)]
+
 def check_win(bet_type, bet_value, winning_number):
     """
     Check if a bet wins based on the winning number.
@@ -182,27 +274,71 @@ def calculate_payout(bet_type, bet_amount):
     Returns:
         int: The payout amount in Rocks (including the original bet)
     """
-    payout_multiplier = BET_TYPES[bet_type]['payout']
-    return bet_amount + (bet_amount * payout_multiplier)
+    return bet_amount * _TOTAL_RETURN[bet_type]
 
-def display_roulette_board():
+def simulate_rounds(bets, n_spins, starting_rocks=100):
     """
-    Display a visual representation of the roulette board.
+    Simulate the same set of bets over many spins for strategy backtesting.
     
-    This function prints a formatted layout of the roulette numbers in a traditional
-    order, with colors indicated for better visualization.
+    Every spin re-places all of the bets, regardless of the balance, and
+    no streak rewards or emergency Rocks are applied. The net result of
+    the bets is worked out once for each of the 37 numbers, so each spin
+    only costs a table lookup (done in a single step when NumPy is installed).
     
+    Args:
+        bets (list): List of (bet_type, bet_value, bet_amount, description) tuples
+        n_spins (int): The number of spins to simulate
+        starting_rocks (int): The balance before the first spin
+        
     Returns:
-        None: Just prints the board layout
+        list: The balance (an int) after each spin, whether or not NumPy is installed
+        
+    Examples:
+        >>> curve = simulate_rounds([('red', None, 10, "Red bet")], 1000)
+        >>> len(curve)
+        1000
+        >>> curve[0] in (90, 110)  # The first spin wins or loses 10 Rocks
+        True
+    """
+    total_stake = sum(bet_amount for _, _, bet_amount, _ in bets)
+    
+    # Net change in balance for every possible winning number
+    net_by_number = [-total_stake] * len(WHEEL_NUMBERS)
+    for bet_type, bet_value, bet_amount, _ in bets:
+        payout = calculate_payout(bet_type, bet_amount)
+        for number in WHEEL_NUMBERS:
+            if check_win(bet_type, bet_value, number):
+                net_by_number[number] += payout
+    
+    spins = spin_many(n_spins)
+    if np is not None:
+        return (starting_rocks + np.cumsum(np.array(net_by_number)[spins])).tolist()
+    
+    balance_curve = []
+    balance = starting_rocks
+    for number in spins:
+        balance += net_by_number[number]
+        balance_curve.append(balance)
+    return balance_curve
+
+def _render_roulette_board():
     """
-    print("\n===== ROULETTE BOARD =====")
+    Render the roulette board layout as a single string.
+    
+    The layout never changes, so this is called once at import time and
+    the result is stored in _BOARD_STR.
+    
+    Returns:
+        str: The formatted board, ending with a newline
+    """
+    lines = ["\n===== ROULETTE BOARD ====="]
     
     # Display 0 separately
-    print("     [0] (GREEN)")
+    lines.append("     [0] (GREEN)")
     
     # Display the main board (1-36) in rows of three
-    print("\n    1st Column    2nd Column    3rd Column")
-    print("    -----------  -----------  -----------")
+    lines.append("\n    1st Column    2nd Column    3rd Column")
+    lines.append("    -----------  -----------  -----------")
     
     for row in range(12):
         line = ""
@@ -213,9 +349,25 @@ def display_roulette_board():
                 line += f"    [{num:2d}] (RED)  "
             else:
                 line += f"    [{num:2d}] (BLK)  "
-        print(line)
+        lines.append(line)
     
-    print("\n=========================")
+    lines.append("\n=========================")
+    return "\n".join(lines) + "\n"
+
+# Pre-rendered board layout
+_BOARD_STR = _render_roulette_board()
+
+def display_roulette_board():
+    """
+    Display a visual representation of the roulette board.
+    
+    This function prints a formatted layout of the roulette numbers in a traditional
+    order, with colors indicated for better visualization.
+    
+    Returns:
+        None: Just prints the board layout
+    """
+    sys.stdout.write(_BOARD_STR)
 
 def get_valid_bet_amount(rocks):
     """
@@ -234,8 +386,8 @@ def get_valid_bet_amount(rocks):
     """
     while True:
         # Show rocks balance above the input prompt
-        print(colorText(f"\nYou have {rocks} Rocks available.", "cyan"))
-        bet_input = input(colorText("How many Rocks do you want to bet? ", "magenta")).lower()
+        cprint(f"\nYou have {rocks} Rocks available.", "cyan")
+        bet_input = normalizeInput(input(colorText("How many Rocks do you want to bet? ", "magenta")))
         
         # Process general commands
         handled, result = processCommand(bet_input, "roulette")
@@ -244,7 +396,7 @@ def get_valid_bet_amount(rocks):
             continue
         
         # Check if player wants to quit
-        if bet_input in ['quit', 'q', 'exit']:
+        if bet_input in _QUIT_TOKENS:
             if confirm_quit():
                 return -1
             else:
@@ -253,14 +405,14 @@ def get_valid_bet_amount(rocks):
         # Handle quick bet commands - but we only use them to validate, not actually place bets here
         isQuickBet, betInfo = processQuickBet(bet_input)
         if isQuickBet:
-            if betInfo["amount"] is not None:
-                betAmount = betInfo["amount"]
+            if betInfo.amount is not None:
+                betAmount = betInfo.amount
                 if betAmount <= 0:
-                    print(colorText("Bet amount must be greater than zero.", "red"))
+                    cprint("Bet amount must be greater than zero.", "red")
                     continue
                     
                 if betAmount > rocks:
-                    print(colorText(f"You only have {rocks} Rocks available.", "red"))
+                    cprint(f"You only have {rocks} Rocks available.", "red")
                     continue
                     
                 return betAmount
@@ -272,17 +424,17 @@ def get_valid_bet_amount(rocks):
             bet_amount = int(bet_input)
             
             if bet_amount <= 0:
-                print(colorText("Bet amount must be greater than zero.", "red"))
+                cprint("Bet amount must be greater than zero.", "red")
                 continue
                 
             if bet_amount > rocks:
-                print(colorText(f"You only have {rocks} Rocks available.", "red"))
+                cprint(f"You only have {rocks} Rocks available.", "red")
                 continue
                 
             return bet_amount
             
         except ValueError:
-            print(colorText("Please enter a valid number.", "red"))
+            cprint("Please enter a valid number.", "red")
 
 def confirm_quit():
     """
@@ -292,15 +444,163 @@ def confirm_quit():
         bool: True if the user confirms quitting, False otherwise
     """
     while True:
-        confirm = input("Confirm quit? (y/n): ").lower()
-        if confirm in ['y', 'yes']:
+        confirm = normalizeInput(input("Confirm quit? (y/n): "))
+        if confirm in _YES_TOKENS:
             print("\nThanks for playing Roulette! Goodbye!")
             return True
-        elif confirm in ['n', 'no']:
+        elif confirm in _NO_TOKENS:
             return False
         else:
             print("Please enter 'y' or 'n'.")
 
+def _parse_small_int(text, low, high):
+    """
+    Parse a small non-negative number typed by the player.
+    
+    Args:
+        text (str): The text entered by the player
+        low (int): The smallest accepted value
+        high (int): The largest accepted value
+        
+    Returns:
+        int or None: The number, or None if the text is not a number in range
+    """
+    text = text.strip()
+    if text.isdecimal():
+        value = int(text)
+        if low <= value <= high:
+            return value
+    return None
+
+def _get_straight_bet():
+    """
+    Get a Straight Up bet on a single number.
+    
+    Returns:
+        tuple: (bet_type, bet_value, description), or (None, None, None) if the player quits
+    """
+    while True:
+        num = normalizeInput(input("Enter a number to bet on (0-36): "))
+        
+        # Check if player wants to quit
+        if num in _QUIT_TOKENS:
+            if confirm_quit():
+                return None, None, None
+            else:
+                continue
+        
+        num = _parse_small_int(num, 0, 36)
+        if num is not None:
+            return 'straight', num, f"Straight Up bet on {num}"
+        else:
+            print("Please enter a number between 0 and 36.")
+
+def _get_split_bet():
+    """
+    Get a Split bet on two adjacent numbers.
+    
+    Returns:
+        tuple: (bet_type, bet_value, description), or (None, None, None) if the player quits
+    """
+    display_roulette_board()
+    print("\nFor a Split bet, enter two adjacent numbers:")
+    while True:
+        input1 = normalizeInput(input("Enter first number (0-36): "))
+        
+        # Check if player wants to quit
+        if input1 in _QUIT_TOKENS:
+            if confirm_quit():
+                return None, None, None
+            else:
+                continue
+        
+        input2 = normalizeInput(input("Enter second number (0-36): "))
+        
+        # Check if player wants to quit
+        if input2 in _QUIT_TOKENS:
+            if confirm_quit():
+                return None, None, None
+            else:
+                continue
+        
+        num1 = _parse_small_int(input1, 0, 36)
+        num2 = _parse_small_int(input2, 0, 36)
+        
+        if num1 is not None and num2 is not None:
+            # Check if numbers are adjacent (simplified version)
+            if abs(num1 - num2) == 1 or abs(num1 - num2) == 3:
+                return 'split', [num1, num2], f"Split bet on {num1} and {num2}"
+            else:
+                print("The numbers must be adjacent on the roulette board.")
+        else:
+            print("Both numbers must be between 0 and 36.")
+
+def _get_street_bet():
+    """
+    Get a Street bet on three numbers in a row.
+    
+    Returns:
+        tuple: (bet_type, bet_value, description), or (None, None, None) if the player quits
+    """
+    display_roulette_board()
+    print("\nFor a Street bet, enter the first number in a row of three.")
+    print(_STREET_STARTS_TEXT)
+    
+    while True:
+        input_num = normalizeInput(input("Enter the starting number: "))
+        
+        # Check if player wants to quit
+        if input_num in _QUIT_TOKENS:
+            if confirm_quit():
+                return None, None, None
+            else:
+                continue
+        
+        num = _parse_small_int(input_num, 0, 36)
+        
+        if num in _STREET_STARTS:
+            street_nums = [num, num+1, num+2]
+            return 'street', street_nums, f"Street bet on {street_nums[0]}, {street_nums[1]}, and {street_nums[2]}"
+        else:
+            print("Please enter a valid starting number for a street bet.")
+
+def _get_corner_bet():
+    """
+    Get a Corner bet on four numbers that form a square.
+    
+    Returns:
+        tuple: (bet_type, bet_value, description), or (None, None, None) if the player quits
+    """
+    display_roulette_board()
+    print("\nFor a Corner bet, enter the smallest number in a square of four.")
+    print(_CORNER_STARTS_TEXT)
+    
+    while True:
+        input_num = normalizeInput(input("Enter the starting number: "))
+        
+        # Check if player wants to quit
+        if input_num in _QUIT_TOKENS:
+            if confirm_quit():
+                return None, None, None
+            else:
+                continue
+        
+        num = _parse_small_int(input_num, 0, 36)
+        
+        if num in _CORNER_STARTS:
+            corner_nums = [num, num+1, num+3, num+4]
+            return 'corner', corner_nums, f"Corner bet on {corner_nums[0]}, {corner_nums[1]}, {corner_nums[2]}, and {corner_nums[3]}"
+        else:
+            print("Please enter a valid starting number for a corner bet.")
+
+# Number bet menu choices and the functions that ask for each bet
+_NUMBER_BETS = {
+    '1': _get_straight_bet,
+    '2': _get_split_bet,
+    '3': _get_street_bet,
+    '4': _get_corner_bet,
+}
+
 def get_valid_number_bet():
     """
     Get a valid number or number combination for betting.
@@ -321,136 +621,34 @@ def get_valid_number_bet():
         print("4. Corner - Bet on four numbers that form a square (pays 8:1)")
         print("5. Return to main betting menu")
         
-        choice = input("\nEnter your choice (1-5): ").lower()
+        choice = normalizeInput(input("\nEnter your choice (1-5): "))
         
         # Check if player wants to quit
-        if choice in ['quit', 'q', 'exit']:
+        if choice in _QUIT_TOKENS:
             if confirm_quit():
                 return None, None, None
             else:
                 continue
         
-        if choice == '1':
-            # Straight Up bet
-            while True:
-                try:
-                    num = input("Enter a number to bet on (0-36): ").lower()
-                    
-                    # Check if player wants to quit
-                    if num in ['quit', 'q', 'exit']:
-                        if confirm_quit():
-                            return None, None, None
-                        else:
-                            continue
-                            
-                    num = int(num)
-                    if 0 <= num <= 36:
-                        return 'straight', num, f"Straight Up bet on {num}"
-                    else:
-                        print("Please enter a number between 0 and 36.")
-                except ValueError:
-                    print("Please enter a valid number.")
-                    
-        elif choice == '2':
-            # Split bet
-            display_roulette_board()
-            print("\nFor a Split bet, enter two adjacent numbers:")
-            while True:
-                try:
-                    input1 = input("Enter first number (0-36): ").lower()
-                    
-                    # Check if player wants to quit
-                    if input1 in ['quit', 'q', 'exit']:
-                        if confirm_quit():
-                            return None, None, None
-                        else:
-                            continue
-                            
-                    input2 = input("Enter second number (0-36): ").lower()
-                    
-                    # Check if player wants to quit
-                    if input2 in ['quit', 'q', 'exit']:
-                        if confirm_quit():
-                            return None, None, None
-                        else:
-                            continue
-                    
-                    num1 = int(input1)
-                    num2 = int(input2)
-                    
-                    if 0 <= num1 <= 36 and 0 <= num2 <= 36:
-                        # Check if numbers are adjacent (simplified version)
-                        if abs(num1 - num2) == 1 or abs(num1 - num2) == 3:
-                            return 'split', [num1, num2], f"Split bet on {num1} and {num2}"
-                        else:
-                            print("The numbers must be adjacent on the roulette board.")
-                    else:
-                        print("Both numbers must be between 0 and 36.")
-                except ValueError:
-                    print("Please enter valid numbers.")
-                    
-        elif choice == '3':
-            # Street bet
-            display_roulette_board()
-            print("\nFor a Street bet, enter the first number in a row of three.")
-            print("Valid starting numbers: 1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34")
-            
-            while True:
-                try:
-                    input_num = input("Enter the starting number: ").lower()
-                    
-                    # Check if player wants to quit
-                    if input_num in ['quit', 'q', 'exit']:
-                        if confirm_quit():
-                            return None, None, None
-                        else:
-                            continue
-                            
-                    num = int(input_num)
-                    valid_starts = [1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34]
-                    
-                    if num in valid_starts:
-                        street_nums = [num, num+1, num+2]
-                        return 'street', street_nums, f"Street bet on {street_nums[0]}, {street_nums[1]}, and {street_nums[2]}"
-                    else:
-                        print("Please enter a valid starting number for a street bet.")
-                except ValueError:
-                    print("Please enter a valid number.")
-                    
-        elif choice == '4':
-            # Corner bet
-            display_roulette_board()
-            print("\nFor a Corner bet, enter the smallest number in a square of four.")
-            print("Valid starting numbers: 1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22, 23, 25, 26, 28, 29, 31, 32, 34")
-            
-            while True:
-                try:
-                    input_num = input("Enter the starting number: ").lower()
-                    
-                    # Check if player wants to quit
-                    if input_num in ['quit', 'q', 'exit']:
-                        if confirm_quit():
-                            return None, None, None
-                        else:
-                            continue
-                            
-                    num = int(input_num)
-                    valid_starts = [1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22, 23, 25, 26, 28, 29, 31, 32, 34]
-                    
-                    if num in valid_starts:
-                        corner_nums = [num, num+1, num+3, num+4]
-                        return 'corner', corner_nums, f"Corner bet on {corner_nums[0]}, {corner_nums[1]}, {corner_nums[2]}, and {corner_nums[3]}"
-                    else:
-                        print("Please enter a valid starting number for a corner bet.")
-                except ValueError:
-                    print("Please enter a valid number.")
-                    
-        elif choice == '5':
+        if choice == '5':
             # Return to main menu
             return 'return_to_main', None, None
             
-        else:
-            print("Invalid choice. Please enter a number between 1 and 5.")
+        get_bet = _NUMBER_BETS.get(choice)
+        if get_bet:
+            return get_bet()
+            
+        print("Invalid choice. Please enter a number between 1 and 5.")
+
+# Outside bet menu choices and the bets they place
+_OUTSIDE_BETS = {
+    '1': ('red', None, "Red bet"),
+    '2': ('black', None, "Black bet"),
+    '3': ('odd', None, "Odd bet"),
+    '4': ('even', None, "Even bet"),
+    '5': ('low', None, "Low (1-18) bet"),
+    '6': ('high', None, "High (19-36) bet"),
+}
 
 def get_valid_outside_bet():
     """
@@ -474,31 +672,29 @@ def get_valid_outside_bet():
         print("6. High (19-36) - Bet on numbers 19-36 (pays 1:1)")
         print("7. Return to main betting menu")
         
-        choice = input("\nEnter your choice (1-7): ").lower()
+        choice = normalizeInput(input("\nEnter your choice (1-7): "))
         
         # Check if player wants to quit
-        if choice in ['quit', 'q', 'exit']:
+        if choice in _QUIT_TOKENS:
             if confirm_quit():
                 return None, None, None
             else:
                 continue
                 
-        if choice == '1':
-            return 'red', None, "Red bet"
-        elif choice == '2':
-            return 'black', None, "Black bet"
-        elif choice == '3':
-            return 'odd', None, "Odd bet"
-        elif choice == '4':
-            return 'even', None, "Even bet"
-        elif choice == '5':
-            return 'low', None, "Low (1-18) bet"
-        elif choice == '6':
-            return 'high', None, "High (19-36) bet"
-        elif choice == '7':
+        if choice == '7':
             return 'return_to_main', None, None
-        else:
-            print("Invalid choice. Please enter a number between 1 and 7.")
+            
+        outside_bet = _OUTSIDE_BETS.get(choice)
+        if outside_bet:
+            return outside_bet
+            
+        print("Invalid choice. Please enter a number between 1 and 7.")
+
+# Betting menu choices that open a bet sub-menu
+_BET_MENUS = {
+    '1': get_valid_number_bet,
+    '2': get_valid_outside_bet,
+}
 
 def place_bets(rocks):
     """
@@ -519,24 +715,26 @@ def place_bets(rocks):
     remaining_rocks = rocks
     
     while remaining_rocks > 0:
-        print(colorText("\n=== BETTING MENU ===", "yellow"))
-        print("1. Place Number Bets (straight, split, street, corner)")
-        print("2. Place Outside Bets (red/black, odd/even, high/low)")
-        print("3. View Current Bets")
-        print("4. Finish Betting and Spin the Wheel")
-        print(colorText("\nQuick betting available! Examples:", "cyan"))
-        print("quick:red 10   - Bet 10 Rocks on red")
-        print("quick:even 20  - Bet 20 Rocks on even numbers")
-        print("quick:0 5      - Bet 5 Rocks on zero")
-        print(colorText("\nPercentage betting available! Examples:", "cyan"))
-        print("quick:red 50%  - Bet 50% of your Rocks on red")
-        print("quick:black 30% - Bet 30% of your Rocks on black")
-        print("Type 'help' for more options")
-        
-        # Display current balance ABOVE the input prompt
-        print(colorText(f"\nYou have {remaining_rocks} Rocks remaining.", "cyan"))
-        
-        choice = input(colorText("\nEnter your choice (1-4) or quick bet command: ", "magenta")).lower()
+        # Colors can be toggled mid-game, so the menu is assembled per display
+        sys.stdout.write("\n".join([
+            colorText("\n=== BETTING MENU ===", "yellow"),
+            "1. Place Number Bets (straight, split, street, corner)",
+            "2. Place Outside Bets (red/black, odd/even, high/low)",
+            "3. View Current Bets",
+            "4. Finish Betting and Spin the Wheel",
+            colorText("\nQuick betting available! Examples:", "cyan"),
+            "quick:red 10   - Bet 10 Rocks on red",
+            "quick:even 20  - Bet 20 Rocks on even numbers",
+            "quick:0 5      - Bet 5 Rocks on zero",
+            colorText("\nPercentage betting available! Examples:", "cyan"),
+            "quick:red 50%  - Bet 50% of your Rocks on red",
+            "quick:black 30% - Bet 30% of your Rocks on black",
+            "Type 'help' for more options",
+            # Display current balance ABOVE the input prompt
+            colorText(f"\nYou have {remaining_rocks} Rocks remaining.", "cyan"),
+        ]) + "\n")
+        
+        choice = normalizeInput(input(colorText("\nEnter your choice (1-4) or quick bet command: ", "magenta")))
         
         # Process general commands
         handled, result = processCommand(choice, "roulette")
@@ -545,7 +743,7 @@ def place_bets(rocks):
             continue
         
         # Check if player wants to quit
-        if choice in ['quit', 'q', 'exit']:
+        if choice in _QUIT_TOKENS:
             if confirm_quit():
                 return -1, []
             else:
@@ -553,80 +751,63 @@ def place_bets(rocks):
                 
         # Handle quick bet commands
         is_quick_bet, bet_info = processQuickBet(choice, remaining_rocks)
+        if bet_info is not None and bet_info.error:
+            cprint(f"Error: {bet_info.error}", "red")
+            continue
+            
         if is_quick_bet:
-            if "error" in bet_info:
-                print(colorText(f"Error: {bet_info['error']}", "red"))
-                continue
-                
-            if bet_info["amount"] is None:
+            if bet_info.amount is None:
                 # Get the amount if not specified in the command
                 bet_amount = get_valid_bet_amount(remaining_rocks)
                 if bet_amount == -1:  # Player chose to quit
                     return -1, []
             else:
-                bet_amount = bet_info["amount"]
+                bet_amount = bet_info.amount
                 if bet_amount > remaining_rocks:
-                    print(colorText(f"You only have {remaining_rocks} Rocks available.", "red"))
+                    cprint(f"You only have {remaining_rocks} Rocks available.", "red")
                     continue
                     
             # Process the main bet
-            bet_type = bet_info["type"]
-            bet_value = bet_info.get("value", None)
-            description = bet_info["description"]
+            bet_type = bet_info.type
+            bet_value = bet_info.value
+            description = bet_info.description
             
             # Indicate if this is a percentage bet
             percentage_text = ""
-            if bet_info.get("is_percentage", False):
-                percentage_text = f" ({bet_amount / rocks * 100:.0f}%)"
+            if bet_info.is_percentage:
+                percentage_text = f" ({bet_info.percentage:g}%)"
             
             bets.append((bet_type, bet_value, bet_amount, description))
             remaining_rocks -= bet_amount
-            print(colorText(f"Quick bet placed: {description} - {bet_amount}{percentage_text} Rocks", "green"))
+            cprint(f"Quick bet placed: {description} - {bet_amount}{percentage_text} Rocks", "green")
             
             # Process any additional bets (for multiple bets separated by semicolons)
-            if "additional_bets" in bet_info and remaining_rocks > 0:
-                for additional_bet in bet_info["additional_bets"]:
-                    add_bet_type = additional_bet["type"]
-                    add_bet_value = additional_bet.get("value", None)
-                    add_bet_desc = additional_bet["description"]
-                    add_bet_amount = additional_bet["amount"]
+            if bet_info.additional_bets and remaining_rocks > 0:
+                for additional_bet in bet_info.additional_bets:
+                    add_bet_type = additional_bet.type
+                    add_bet_value = additional_bet.value
+                    add_bet_desc = additional_bet.description
+                    add_bet_amount = additional_bet.amount
                     
                     # Skip if not enough rocks remaining
                     if add_bet_amount > remaining_rocks:
-                        print(colorText(f"Skipping bet on {add_bet_desc} - Not enough Rocks remaining", "red"))
+                        cprint(f"Skipping bet on {add_bet_desc} - Not enough Rocks remaining", "red")
                         continue
                     
                     # Add percentage text if needed
                     add_percentage_text = ""
-                    if additional_bet.get("is_percentage", False):
-                        add_percentage_text = f" ({add_bet_amount / rocks * 100:.0f}%)"
+                    if additional_bet.is_percentage:
+                        add_percentage_text = f" ({additional_bet.percentage:g}%)"
                     
                     bets.append((add_bet_type, add_bet_value, add_bet_amount, add_bet_desc))
                     remaining_rocks -= add_bet_amount
-                    print(colorText(f"Additional bet placed: {add_bet_desc} - {add_bet_amount}{add_percentage_text} Rocks", "green"))
+                    cprint(f"Additional bet placed: {add_bet_desc} - {add_bet_amount}{add_percentage_text} Rocks", "green")
             continue
                 
-        if choice == '1':
-            # Number bets
-            bet_type, bet_value, description = get_valid_number_bet()
-            
-            if bet_type is None:  # Player chose to quit
-                return -1, []
-                
-            if bet_type == 'return_to_main':
-                continue
-                
-            bet_amount = get_valid_bet_amount(remaining_rocks)
-            
-            if bet_amount == -1:  # Player chose to quit
-                return -1, []
-                
-            bets.append((bet_type, bet_value, bet_amount, description))
-            remaining_rocks -= bet_amount
-            
-        elif choice == '2':
-            # Outside bets
-            bet_type, bet_value, description = get_valid_outside_bet()
+        # Number bets or outside bets
+        get_bet = _BET_MENUS.get(choice)
+        if get_bet:
+            bet_type, bet_value, description = get_bet()
             
             if bet_type is None:  # Player chose to quit
                 return -1, []
@@ -682,33 +863,7 @@ def display_game_rules():
     Returns:
         None: This function just prints information
     """
-    print("\n" + "=" * 70)
-    print(" " * 25 + "ROULETTE RULES")
-    print("=" * 70)
-    
-    print("\nRoulette is a game where you bet on where a ball will land on a spinning wheel.")
-    print("The wheel has numbers 0-36, with 0 being green, and the rest being red or black.")
-    
-    print("\nBetting Options:")
-    print("- Inside Bets (Higher Payout):")
-    print("  • Straight Up: Bet on a single number (pays 35:1)")
-    print("  • Split: Bet on two adjacent numbers (pays 17:1)")
-    print("  • Street: Bet on three numbers in a row (pays 11:1)")
-    print("  • Corner: Bet on four numbers that form a square (pays 8:1)")
-    
-    print("\n- Outside Bets (Lower Payout):")
-    print("  • Red/Black: Bet on all red or all black numbers (pays 1:1)")
-    print("  • Odd/Even: Bet on all odd or all even numbers (pays 1:1)")
-    print("  • Low/High: Bet on numbers 1-18 or 19-36 (pays 1:1)")
-    
-    print("\nNote: If the ball lands on 0 (green), all outside bets lose.")
-    print("You can place multiple bets in a single round.")
-    
-    print("\nFor example, if you bet 10 Rocks on Straight Up and win, you'd get 360 Rocks back:")
-    print("  • Your original 10 Rocks + (10 Rocks × 35) = 360 Rocks")
-    
-    print("\nType 'quit' or 'q' at any prompt to exit the game.")
-    print("-" * 70)
+    sys.stdout.write(_RULES_TEXT)
 
 def process_bet_results(bets, winning_number, rocks_before_betting):
     """
@@ -722,11 +877,16 @@ def process_bet_results(bets, winning_number, rocks_before_betting):
     Returns:
         tuple: (int, bool) - (The player's new rock balance, True if player won this round)
     """
+    current_streak, max_streak = getStreakData("roulette")
+    
     winning_color = get_color(winning_number)
     total_winnings = 0
     new_balance = rocks_before_betting
     any_win = False
     
+    # The round's output is collected and written in one go
+    out = []
+    
     # Get the winning number's display with color
     if winning_color == "red":
         number_display = colorText(f"{winning_number} {winning_color.upper()}", "red")
@@ -744,28 +904,22 @@ def process_bet_results(bets, winning_number, rocks_before_betting):
             payout = calculate_payout(bet_type, bet_amount)
             total_winnings += payout
             new_balance += payout
-            win_text = colorText(f"\nWIN! {description} - Won {payout} Rocks (Bet: {bet_amount}, Payout: {payout-bet_amount})", "green")
-            print(win_text)
+            out.append(colorText(f"\nWIN! {description} - Won {payout} Rocks (Bet: {bet_amount}, Payout: {payout-bet_amount})", "green"))
         else:
-            loss_text = colorText(f"\nLOSS! {description} - Lost {bet_amount} Rocks", "red")
-            print(loss_text)
+            out.append(colorText(f"\nLOSS! {description} - Lost {bet_amount} Rocks", "red"))
     
     net_profit = new_balance - rocks_before_betting
-    print(f"\nResult: {number_display}")
+    out.append(f"\nResult: {number_display}")
     
     if net_profit > 0:
-        result_text = colorText(f"Congratulations! You won a total of {net_profit} Rocks!", "green")
-        print(result_text)
+        out.append(colorText(f"Congratulations! You won a total of {net_profit} Rocks!", "green"))
     elif net_profit < 0:
-        result_text = colorText(f"Too bad! You lost a total of {abs(net_profit)} Rocks.", "red")
-        print(result_text)
+        out.append(colorText(f"Too bad! You lost a total of {abs(net_profit)} Rocks.", "red"))
     else:
-        print("You broke even - no Rocks gained or lost.")
+        out.append("You broke even - no Rocks gained or lost.")
     
     # Update win streak if player won overall
     if any_win and net_profit > 0:
-        # Get current streak
-        current_streak, max_streak = getStreakData("roulette")
         current_streak += 1
         max_streak = max(current_streak, max_streak)
         
@@ -775,16 +929,17 @@ def process_bet_results(bets, winning_number, rocks_before_betting):
         # Check for streak rewards
         reward_amount, message = getWinStreakReward(current_streak, "roulette")
         if reward_amount > 0:
-            print(message)
+            out.append(message)
             new_balance += reward_amount
             
-        streak_info = colorText(f"Current win streak: {current_streak}", "cyan")
-        print(streak_info)
+        out.append(colorText(f"Current win streak: {current_streak}", "cyan"))
     elif net_profit <= 0:
         # Reset streak on loss
-        saveStreakData("roulette", 0, getStreakData("roulette")[1])
+        current_streak = 0
+        saveStreakData("roulette", current_streak, max_streak)
         
-    print(colorText(f"New balance: {new_balance} Rocks", "cyan"))
+    out.append(colorText(f"New balance: {new_balance} Rocks", "cyan"))
+    sys.stdout.write("\n".join(out) + "\n")
     
     return new_balance, any_win and net_profit > 0
 
@@ -811,26 +966,25 @@ def play_roulette(initial_rocks=100):
     display_game_rules()
     
     # Welcome message with win streak info
-    streak_data = getStreakData("roulette")
-    current_streak, max_streak = streak_data
+    current_streak, max_streak = getStreakData("roulette")
     if max_streak > 0:
-        print(colorText(f"\nWelcome back! Your longest win streak is {max_streak}.", "cyan"))
+        cprint(f"\nWelcome back! Your longest win streak is {max_streak}.", "cyan")
         if current_streak > 0:
-            print(colorText(f"Current win streak: {current_streak}", "green"))
-            print(colorText("Keep winning to earn streak rewards!", "yellow"))
+            cprint(f"Current win streak: {current_streak}", "green")
+            cprint("Keep winning to earn streak rewards!", "yellow")
     
     while True:
-        print(colorText(f"\nYou have {rocks} Rocks.", "cyan"))
+        out = [colorText(f"\nYou have {rocks} Rocks.", "cyan")]
         
         # Check if player has enough rocks to continue
         if rocks <= 0:
-            print(colorText("\nYou're out of Rocks!", "red"))
-            emergency_rocks = 50
-            print(colorText(f"Here's an emergency {emergency_rocks} Rocks to keep playing.", "green"))
-            rocks = emergency_rocks
+            out.append(colorText("\nYou're out of Rocks!", "red"))
+            out.append(colorText(_EMERGENCY_ROCKS_TEXT, "green"))
+            rocks = EMERGENCY_ROCKS
             
-        # Display the roulette board
-        display_roulette_board()
+        # Display the balance and the roulette board together
+        out.append(_BOARD_STR)
+        sys.stdout.write("\n".join(out))
         
         # Place bets
         rocks_before_betting = rocks
@@ -854,39 +1008,34 @@ def play_roulette(initial_rocks=100):
         # Ask to play again
         print("\nDo you want to play another round?")
         while True:
-            play_again = input("Enter 'y' to continue or 'n' to exit (or type 'help' for options): ").lower()
+            play_again = normalizeInput(input("Enter 'y' to continue or 'n' to exit (or type 'help' for options): "))
             
-            # Process general commands
-            handled, result = processCommand(play_again, "roulette")
-            if handled:
-                print(result)
-                continue
-                
-            if play_again in ['y', 'yes']:
+            # Check the common answers first so they skip command processing
+            if play_again in _YES_TOKENS:
                 break
-            elif play_again in ['n', 'no', 'quit', 'q', 'exit']:
-                print(colorText("\nThanks for playing Roulette! Goodbye!", "cyan"))
+            elif play_again in _LEAVE_TOKENS:
+                cprint("\nThanks for playing Roulette! Goodbye!", "cyan")
                 
                 # Show final stats
-                streak_data = getStreakData("roulette")
-                _, max_streak = streak_data
+                _, max_streak = getStreakData("roulette")
                 if max_streak > 0:
-                    print(colorText(f"Your best win streak was: {max_streak}", "yellow"))
+                    cprint(f"Your best win streak was: {max_streak}", "yellow")
                     
-                if rocks > initial_rocks:
-                    profit = rocks - initial_rocks
-                    print(colorText(f"You're leaving with a profit of {profit} Rocks!", "green"))
-                elif rocks < initial_rocks:
-                    loss = initial_rocks - rocks
-                    print(colorText(f"You're leaving with a loss of {loss} Rocks.", "red"))
+                delta = rocks - initial_rocks
+                if delta:
+                    kind, color, end = ("profit", "green", "!") if delta > 0 else ("loss", "red", ".")
+                    cprint(f"You're leaving with a {kind} of {abs(delta)} Rocks{end}", color)
                 else:
                     print("You broke even!")
                     
                 return rocks
+                
+            # Process general commands
+            handled, result = processCommand(play_again, "roulette")
+            if handled:
+                print(result)
             else:
                 print("Please enter 'y' to continue or 'n' to exit.")
-            
-    return rocks
 
 def rouletteLoop():
     """
@@ -903,13 +1052,13 @@ def rouletteLoop():
         play_roulette()
     except KeyboardInterrupt:
         print("\n\nGame interrupted. Exiting Roulette...")
-        time.sleep(1)
-        sys.exit(0)
     except Exception as e:
         print(f"\nAn error occurred: {str(e)}")
         print("Exiting Roulette...")
-        time.sleep(1)
-        sys.exit(1)
+        raise SystemExit(1)
+    finally:
+        # Write the session's streak changes in one go
+        flushStreakData()
 
 if __name__ == "__main__":
     rouletteLoop()
\ No newline at end of file
@@ -9,6 +9,36 @@ competes against the computer. The game follows standard Rock Paper Scissors rul
 """
 
 import random
+from utils_terminal import normalizeInput
+
+# Possible choices and their display names
+_RPS_CHOICES = ('r', 'p', 's')
+_CHOICE_NAMES = {'r': 'Rock', 'p': 'Paper', 's': 'Scissors'}
+
+# Accepted spellings of each choice
+_ALIASES = {
+    'r': 'r', 'rock': 'r',
+    'p': 'p', 'paper': 'p',
+    's': 's', 'scissors': 's',
+}
+
+# Accepted answers at the input prompts
+_QUIT_TOKENS = frozenset({'quit', 'q', 'exit'})
+_YES_TOKENS = frozenset({'y', 'yes'})
+_NO_TOKENS = frozenset({'n', 'no'})
+
+# Result message for every (player, computer) pair of choices
+_RESULTS = {
+    ('r', 'r'): "It's a tie.",
+    ('r', 'p'): "Computer wins.",
+    ('r', 's'): "You win.",
+    ('p', 'r'): "You win.",
+    ('p', 'p'): "It's a tie.",
+    ('p', 's'): "Computer wins.",
+    ('s', 'r'): "Computer wins.",
+    ('s', 'p'): "You win.",
+    ('s', 's'): "It's a tie.",
+}
 
 def rps(user, comp):
     """
@@ -21,18 +51,7 @@ def rps(user, comp):
     Returns:
         str: A message indicating the result of the game (win, loss, tie, or invalid input)
     """
-    user = user.lower()
-    
-    if user == comp:
-        return "It's a tie."
-    elif user == 'r':
-        return "You win." if comp == 's' else "Computer wins."
-    elif user == 'p':
-        return "You win." if comp == 'r' else "Computer wins."
-    elif user == 's':
-        return "You win." if comp == 'p' else "Computer wins."
-    else:
-        return "Invalid input. Please enter R, P, or S (case insensitive)."
+    return _RESULTS.get((user.lower(), comp), "Invalid input. Please enter R, P, or S (case insensitive).")
 
 def confirm_quit():
     """
@@ -42,11 +61,11 @@ def confirm_quit():
         bool: True if the user confirms quitting, False otherwise
     """
     while True:
-        confirm = input("Confirm quit? (y/n): ").lower()
-        if confirm in ['y', 'yes']:
+        confirm = normalizeInput(input("Confirm quit? (y/n): "))
+        if confirm in _YES_TOKENS:
             print("\nThanks for playing shygyGames! Goodbye!")
             return True
-        elif confirm in ['n', 'no']:
+        elif confirm in _NO_TOKENS:
             return False
         else:
             print("Please enter 'y' or 'n'.")
@@ -61,38 +80,33 @@ def play_rps():
     Returns:
         None
     """
-    rps_choices = ['r', 'p', 's']
-    choice_full_names = {'r': 'Rock', 'p': 'Paper', 's': 'Scissors'}
-    
     print("\n=== Welcome to Rock Paper Scissors! ===\n")
     
     while True:
         # Get player choice with improved error handling
         while True:
-            userRPS = input("Choose: Rock (R), Paper (P), or Scissors (S): ").lower()
+            choice = normalizeInput(input("Choose: Rock (R), Paper (P), or Scissors (S): "))
             
             # Check if the user wants to quit
-            if userRPS in ['quit', 'q', 'exit']:
+            if choice in _QUIT_TOKENS:
                 if confirm_quit():
                     return
                 else:
                     continue
                     
-            if userRPS in ['r', 'p', 's'] or userRPS in ['rock', 'paper', 'scissors']:
-                # Convert full word inputs to single letter
-                if userRPS == 'rock': userRPS = 'r'
-                elif userRPS == 'paper': userRPS = 'p'
-                elif userRPS == 'scissors': userRPS = 's'
+            # Convert full word inputs to single letter
+            userRPS = _ALIASES.get(choice)
+            if userRPS:
                 break
             else:
                 print("Invalid input. Please enter R, P, or S (case insensitive).")
         
         # Generate computer choice
-        compSelection = random.choice(rps_choices)
+        compSelection = _RPS_CHOICES[random.randrange(3)]
         
         # Display choices
-        print(f"You chose: {choice_full_names[userRPS]}")
-        print(f"Computer chose: {choice_full_names[compSelection]}")
+        print(f"You chose: {_CHOICE_NAMES[userRPS]}")
+        print(f"Computer chose: {_CHOICE_NAMES[compSelection]}")
         
         # Determine and display result
         result = rps(userRPS, compSelection)
@@ -100,21 +114,21 @@ def play_rps():
         
         # Ask to play again with improved error handling
         while True:
-            play_again = input("Play again? (y/n): ").lower()
+            play_again = normalizeInput(input("Play again? (y/n): "))
             
             # Check if the user wants to quit
-            if play_again in ['quit', 'q', 'exit']:
+            if play_again in _QUIT_TOKENS:
                 if confirm_quit():
                     return
                 else:
                     continue
                     
-            if play_again in ['y', 'n', 'yes', 'no']:
+            if play_again in _YES_TOKENS or play_again in _NO_TOKENS:
                 break
             else:
                 print("Invalid input. Please enter Y or N (case insensitive).")
         
-        if play_again not in ['y', 'yes']:
+        if play_again not in _YES_TOKENS:
             print("\nThanks for playing Rock Paper Scissors!\n")
             break
 
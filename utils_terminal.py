@@ -6,22 +6,27 @@ including color coding, help system, win streak tracking, and other common funct
 
 Functions in this module:
 - colorText: Apply color to text if color is enabled
+- cprint: Print text in a color on its own line
+- normalizeInput: Lowercase player input for comparisons
 - toggleColor: Toggle color output on or off
 - getColorState: Get the current state of color output
 - createDataDirectory: Create a data directory for storing game state
 - saveStreakData: Save win streak data for a game
 - getStreakData: Get win streak data for a game
+- flushStreakData: Write pending win streak changes to disk
 - handleHelpCommand: Display help information for a specific game
 - processCommand: Process a common command across all games
 - getWinStreakReward: Calculate reward for a win streak
 - processQuickBet: Process a quick bet command for Roulette
 - getRockBalance: Get the current rock balance for the player
 - updateRockBalance: Update the player's rock balance
+- flushPendingWrites: Write queued balance and statistics changes to disk
 - saveGameStats: Save game statistics for tracking performance
-- getGameStats: Get statistics for a specific game
+- getGameStats: Get a copy of the statistics for a specific game
+- dumpStatsPretty: Format saved game statistics as indented JSON
 
 Classes:
-    None
+    QuickBet: Immutable record describing a parsed Roulette quick bet
 
 Constants:
     COLOR_CODES: Dictionary of ANSI color codes for terminal text coloring
@@ -29,12 +34,61 @@ Constants:
     DEFAULT_ROCKS: Default starting rocks for a new player
 """
 
-import os
+import sys
 import json
+import atexit
+import copy
+import heapq
 import time
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 from datetime import datetime
 from pathlib import Path
 
+# Optional faster JSON libraries, preferred over the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# JSON encoding and decoding for the save files, using the fastest library
+# available. _jsonDumps returns bytes, _jsonLoads accepts bytes, and every
+# backend reports malformed data with a ValueError subclass. Data a faster
+# library can't encode (such as integers too large for it) is encoded with
+# the standard json module, so every backend accepts the same data.
+def _stdlibJsonDumps(data, indent=None):
+    separators = (',', ':') if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators).encode()
+
+if orjson is not None:
+    _jsonLoads = orjson.loads
+
+    def _jsonDumps(data, indent=None):
+        # Non-string keys (e.g. ints) are turned into strings like json does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            return _stdlibJsonDumps(data, indent)
+elif ujson is not None:
+    _jsonLoads = ujson.loads
+
+    def _jsonDumps(data, indent=None):
+        try:
+            return ujson.dumps(data, indent=indent or 0).encode()
+        except (TypeError, OverflowError):
+            return _stdlibJsonDumps(data, indent)
+else:
+    _jsonLoads = json.loads
+    _jsonDumps = _stdlibJsonDumps
+
 # Global variables
 _colorEnabled = True  # Default state for color coding
 DEFAULT_ROCKS = 100  # Default starting rocks for a new player
@@ -49,11 +103,43 @@ CHEAT_CODES = {
     "tutorial": {"description": "Start tutorial mode", "action": "tutorial", "value": True}
 }
 
+# Cheat codes keyed by lowercased code, for case-insensitive lookup
+_CHEAT_CODES_LC = {code.lower(): cheat for code, cheat in CHEAT_CODES.items()}
+
 # Global settings
 _rainbowTextMode = False  # Rainbow text mode (cheat code reward)
 _debugMode = False  # Debug mode for showing advanced game information
 _tutorialMode = False  # Tutorial mode for guided gameplay
 
+# Save file locations, resolved once at import
+_DATA_DIR = Path.home() / ".shygygames"
+_SAVE_DIR = _DATA_DIR / "saved_games"
+_STATE_FILE = _DATA_DIR / "state.json"  # Rock balance, win streaks and statistics
+_HISTORY_FILE = _DATA_DIR / "roulette_history.json"
+# Separate files used before the state file existed; read once to migrate
+_STREAK_FILE = _DATA_DIR / "win_streaks.json"
+_BALANCE_FILE = _DATA_DIR / "rocks_balance.json"
+_STATS_FILE = _DATA_DIR / "game_stats.json"
+_dataDirReady = False  # Set once createDataDirectory has made sure _DATA_DIR exists
+_fallbackState = None  # Unsaved state used while the state file can't be loaded safely
+
+_jsonCache = {}  # Parsed JSON files keyed by path, as ((mtime in ns, size), data)
+_pendingWrites = {}  # JSON files waiting to be written, as path -> (data, indent, description)
+_pendingUpdates = 0  # Updates queued since the last flushPendingWrites call
+_lastFlush = 0.0  # time.monotonic() of the last flushPendingWrites call
+_FLUSH_INTERVAL = 2.0  # Seconds after which queued updates are written
+_FLUSH_BATCH = 8  # Number of queued updates that triggers an early write
+_TOP_WINS = 10  # Number of largest wins kept per game in the statistics
+
+# Color used to print each spin type in the roulette history (white stays visible on black terminals)
+_SPIN_NUMBER_COLORS = {"red": "red", "black": "white", "green": "green"}
+# Display color of each number on the wheel, indexed by number (0 is green)
+_ROULETTE_RED_NUMBERS = frozenset((1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36))
+_ROULETTE_NUMBER_COLORS = tuple(
+    "green" if number == 0 else _SPIN_NUMBER_COLORS["red" if number in _ROULETTE_RED_NUMBERS else "black"]
+    for number in range(37)
+)
+
 # ANSI color codes
 COLOR_CODES = {
     'red': '\033[91m',
@@ -75,6 +161,12 @@ COLOR_CODES = {
     'purple': '\033[38;5;165m'
 }
 
+# (prefix, suffix) pairs for wrapping text in each color
+_RESET = COLOR_CODES['reset']
+_COLOR_WRAP = {color: (code, _RESET) for color, code in COLOR_CODES.items()}
+# Color codes cycled through character by character in rainbow mode
+_RAINBOW_PREFIXES = tuple(COLOR_CODES[c] for c in ('red', 'orange', 'lightyellow', 'lightgreen', 'lightblue', 'purple'))
+
 def colorText(text, color):
     """
     Apply color to text if color is enabled.
@@ -102,24 +194,58 @@ def colorText(text, color):
         
     if color == "rainbow" or _rainbowTextMode:
         if _rainbowTextMode:
-            # Apply rainbow coloring (each character gets a different color)
-            rainbow_colors = ['red', 'orange', 'lightyellow', 'lightgreen', 'lightblue', 'purple']
-            result = ""
-            for i, char in enumerate(text):
-                if char.strip():  # Only color non-whitespace characters
-                    color_idx = i % len(rainbow_colors)
-                    result += f"{COLOR_CODES[rainbow_colors[color_idx]]}{char}{COLOR_CODES['reset']}"
-                else:
-                    result += char
-            return result
+            # Apply rainbow coloring (each character gets a different color,
+            # whitespace is left uncolored)
+            palette = _RAINBOW_PREFIXES
+            n = len(palette)
+            return "".join([
+                char if char.isspace() else palette[i % n] + char + _RESET
+                for i, char in enumerate(text)
+            ])
         else:
             # Rainbow requested but not enabled via cheat code
             return text
     
-    if color not in COLOR_CODES:
-        return text
+    wrap = _COLOR_WRAP.get(color)
+    return text if wrap is None else f"{wrap[0]}{text}{wrap[1]}"
+
+def cprint(text, color):
+    """
+    Print text in a color on its own line.
+    
+    This is a shorthand for print(colorText(text, color)) that writes the
+    line to stdout in a single call.
     
-    return f"{COLOR_CODES[color]}{text}{COLOR_CODES['reset']}"
+    Args:
+        text (str): The text to print
+        color (str): The color to use (see colorText)
+        
+    Returns:
+        None
+        
+    Examples:
+        >>> cprint("You win!", "green")
+        You win!  # shown in green if color is enabled
+    """
+    sys.stdout.write(colorText(text, color) + "\n")
+
+def normalizeInput(text):
+    """
+    Lowercase player input, skipping the copy when it is already lowercase.
+    
+    Args:
+        text (str): The text entered by the player
+        
+    Returns:
+        str: The lowercase text
+        
+    Examples:
+        >>> normalizeInput("Y")
+        'y'
+        >>> normalizeInput("quit")
+        'quit'
+    """
+    return text if text.islower() else text.lower()
 
 def toggleColor():
     """
@@ -173,17 +299,304 @@ def createDataDirectory():
         >>> dataDir.exists()
         True
     """
-    dataDir = Path.home() / ".shygygames"
-    if not dataDir.exists():
-        dataDir.mkdir(exist_ok=True)
-    return dataDir
+    global _dataDirReady
+    if not _dataDirReady:
+        _DATA_DIR.mkdir(exist_ok=True)
+        _dataDirReady = True
+    return _DATA_DIR
+
+def _fileStamp(path):
+    """
+    Get the (modification time in ns, size) pair used to detect file changes.
+    
+    The size catches a rewrite that lands within the same timestamp tick
+    on file systems with coarse modification times.
+    
+    Raises:
+        IOError: If the file doesn't exist or can't be accessed
+    """
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+def _readJsonCached(path, default=None):
+    """
+    Read a JSON file, reusing the parsed data while the file is unchanged.
+    
+    The file is only read and parsed again when its modification time or
+    size changes, so repeated lookups cost a single stat call. The returned data
+    is shared with the cache: callers must not modify it unless they save
+    it back to the same file.
+    
+    Args:
+        path (Path): The JSON file to read
+        default: The value to return if the file is missing or unreadable
+        
+    Returns:
+        The parsed JSON data, or default
+    """
+    # Data waiting to be written is newer than anything on disk
+    pending = _pendingWrites.get(path)
+    if pending is not None:
+        return pending[0]
+    
+    try:
+        stamp = _fileStamp(path)
+        cached = _jsonCache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = _jsonLoads(path.read_bytes())
+    except (ValueError, IOError):
+        return default
+    
+    _jsonCache[path] = (stamp, data)
+    return data
+
+def _primeJsonCache(path, data):
+    """
+    Record data that was just written to a JSON file in the read cache.
+    
+    Args:
+        path (Path): The JSON file that was written
+        data: The data written to it
+    """
+    try:
+        _jsonCache[path] = (_fileStamp(path), data)
+    except IOError:
+        _jsonCache.pop(path, None)
+
+def _atomicWriteJson(path, data, indent=None):
+    """
+    Write data to a JSON file without ever leaving it half-written.
+    
+    The JSON is written to a temporary file next to the target, which then
+    replaces the target in a single rename, so a crash mid-write leaves the
+    previous contents intact. Missing data directories are created on the
+    first write.
+    
+    Args:
+        path (Path): The JSON file to write
+        data: The data to save
+        indent (int, optional): Indentation for readable output; compact if None
+        
+    Raises:
+        IOError: If the file could not be written
+    """
+    payload = _jsonDumps(data, indent)
+    tmpPath = path.with_name(path.name + ".tmp")
+    try:
+        tmpPath.write_bytes(payload)
+    except FileNotFoundError:
+        # First save (or the data was reset): create the directory and retry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmpPath.write_bytes(payload)
+    tmpPath.replace(path)
+
+def _scheduleJsonWrite(path, data, description, indent=None):
+    """
+    Queue data to be written to a JSON file.
+    
+    Reads of the file see the queued data straight away. Queued data is
+    written once _FLUSH_BATCH updates have piled up or _FLUSH_INTERVAL
+    seconds have passed since the last write, so a burst of updates (such
+    as a balance, streak and stats change every round) costs a single write.
+    
+    Args:
+        path (Path): The JSON file to write
+        data: The data to save
+        description (str): What the file holds, used in warning messages
+        indent (int, optional): Indentation for readable output; compact if None
+    """
+    global _pendingUpdates
+    
+    _pendingWrites[path] = (data, indent, description)
+    _pendingUpdates += 1
+    if _pendingUpdates >= _FLUSH_BATCH or time.monotonic() - _lastFlush >= _FLUSH_INTERVAL:
+        flushPendingWrites()
+
+def flushPendingWrites():
+    """
+    Write all queued JSON data to disk.
+    
+    This function saves the balance, streak, statistics and roulette
+    history changes queued by updateRockBalance, saveStreakData,
+    saveGameStats and saveRouletteSpinHistory. It is also called
+    automatically when the program exits.
+    
+    Returns:
+        bool: True if everything was written, False if any file failed
+        
+    Examples:
+        >>> updateRockBalance(150)
+        150
+        >>> flushPendingWrites()  # state.json now holds the balance of 150
+        True
+    """
+    global _lastFlush, _pendingUpdates
+    
+    _lastFlush = time.monotonic()
+    _pendingUpdates = 0
+    success = True
+    
+    while _pendingWrites:
+        path, (data, indent, description) = _pendingWrites.popitem()
+        try:
+            _atomicWriteJson(path, data, indent)
+            _primeJsonCache(path, data)
+        except (TypeError, ValueError):
+            # The data can't be stored as JSON; forget it so the file is read again
+            _jsonCache.pop(path, None)
+            print(colorText(f"Warning: Could not save {description}: invalid data.", "yellow"))
+            success = False
+        except IOError:
+            print(colorText(f"Warning: Could not save {description}.", "yellow"))
+            success = False
+            
+    return success
+
+# Make sure queued writes are saved even if a game exits abnormally
+atexit.register(flushPendingWrites)
+
+def _migrateLegacyState():
+    """
+    Build the combined game state from the older separate save files.
+    
+    Returns:
+        dict: State with "balance", "last_updated", "streaks" and "stats" keys
+    """
+    balanceData = _readJsonCached(_BALANCE_FILE) or {}
+    return {
+        "balance": balanceData.get("balance", DEFAULT_ROCKS),
+        "last_updated": balanceData.get("last_updated", ""),
+        "streaks": _readJsonCached(_STREAK_FILE) or {},
+        "stats": _readJsonCached(_STATS_FILE) or {"games": {}},
+    }
+
+def _finishMigration(state):
+    """
+    Write the migrated state and retire the older separate save files.
+    
+    The older files are renamed with a ".migrated" suffix, and only once the
+    state file has been written, so they are never migrated a second time.
+    If the write fails they are kept and the write is retried later.
+    
+    Args:
+        state (dict): The state built by _migrateLegacyState
+    """
+    try:
+        _atomicWriteJson(_STATE_FILE, state)
+    except IOError:
+        _saveState(state)
+        return
+    _primeJsonCache(_STATE_FILE, state)
+    
+    for legacyFile in (_BALANCE_FILE, _STATS_FILE, _STREAK_FILE):
+        try:
+            legacyFile.replace(legacyFile.with_name(legacyFile.name + ".migrated"))
+        except FileNotFoundError:
+            pass
+        except IOError:
+            print(colorText(f"Warning: Could not retire {legacyFile.name}.", "yellow"))
+
+def _loadState():
+    """
+    Get the combined rock balance, win streak and statistics data.
+    
+    All three live in a single state file so one read (usually served from
+    the cache) and one write cover them all. If the state file doesn't exist
+    yet, it is created from the older separate save files. A state file that
+    can't be parsed is moved aside to a uniquely named state.json.corrupt-*
+    backup and replaced by a new state, rather than by the older files' data.
+    If it can't be read at all, or can't be backed up, an unsaved in-memory
+    state is used instead so the file is never overwritten.
+    
+    Returns:
+        dict: The shared game state; modify it only together with _saveState
+    """
+    state = _readJsonCached(_STATE_FILE)
+    if state is not None:
+        return state
+    
+    # Find out why the state file couldn't be read
+    try:
+        state = _jsonLoads(_STATE_FILE.read_bytes())
+    except FileNotFoundError:
+        # First run with the state file: migrate the older save files once
+        state = _migrateLegacyState()
+        _finishMigration(state)
+        return state
+    except ValueError:
+        state = None  # Corrupt, handled below
+    except IOError:
+        # Possibly temporary (permissions, a lock): never replace the file
+        return _useFallbackState("Warning: Could not read game data; changes this session won't be saved.")
+    
+    if isinstance(state, dict):
+        # Readable after all (it changed between the two reads)
+        _primeJsonCache(_STATE_FILE, state)
+        return state
+    
+    # Corrupt: keep it under a unique name, then start a new state file
+    backupPath = _STATE_FILE.with_name(f"{_STATE_FILE.name}.corrupt-{datetime.now():%Y%m%d-%H%M%S-%f}")
+    try:
+        _STATE_FILE.replace(backupPath)
+    except IOError:
+        return _useFallbackState("Warning: Game data is damaged and could not be backed up; changes this session won't be saved.")
+    
+    print(colorText(f"Warning: Game data was damaged and has been moved to {backupPath.name}; starting fresh.", "yellow"))
+    state = _newState()
+    _saveState(state)
+    return state
+
+def _newState():
+    """
+    Create the state of a player with no saved data.
+    
+    Returns:
+        dict: State with the default balance and no streaks or statistics
+    """
+    return {"balance": DEFAULT_ROCKS, "last_updated": "", "streaks": {}, "stats": {"games": {}}}
+
+def _useFallbackState(warning):
+    """
+    Get the in-memory state used while the state file can't be loaded safely.
+    
+    The fallback state is never written, so the file on disk is left as it is;
+    _loadState switches back to the file as soon as it can be read again.
+    
+    Args:
+        warning (str): Shown the first time the fallback state is used
+        
+    Returns:
+        dict: The fallback state, shared for the rest of the session
+    """
+    global _fallbackState
+    
+    if _fallbackState is None:
+        print(colorText(warning, "yellow"))
+        _fallbackState = _newState()
+    return _fallbackState
+
+def _saveState(state):
+    """
+    Queue the combined game state to be written to disk.
+    
+    The state is written as compact JSON; in debug mode it is indented so the
+    file is easier to read. Use dumpStatsPretty to look at the statistics.
+    
+    Args:
+        state (dict): The state returned by _loadState, after changes
+    """
+    if state is _fallbackState:
+        return  # The state file couldn't be loaded; leave it untouched
+    _scheduleJsonWrite(_STATE_FILE, state, "game data", indent=2 if _debugMode else None)
 
 def saveStreakData(gameName, winCount, maxStreak):
     """
     Save win streak data for a game.
     
-    This function persistently stores the current and maximum win streaks
-    for a specific game in a JSON file.
+    This function stores the current and maximum win streaks for a
+    specific game. The change is visible to getStreakData immediately and
+    written to disk by flushPendingWrites.
     
     Args:
         gameName (str): The name of the game (e.g., "roulette", "blackjack")
@@ -197,18 +610,8 @@ def saveStreakData(gameName, winCount, maxStreak):
         >>> saveStreakData("roulette", 3, 5)  # Current streak is 3, max was 5
         >>> saveStreakData("blackjack", 0, 7)  # Reset current streak, max was 7
     """
-    dataDir = createDataDirectory()
-    streakFile = dataDir / "win_streaks.json"
-    
-    # Initialize or load existing data
-    if streakFile.exists():
-        with open(streakFile, 'r') as f:
-            try:
-                streaks = json.load(f)
-            except json.JSONDecodeError:
-                streaks = {}
-    else:
-        streaks = {}
+    state = _loadState()
+    streaks = state["streaks"]
     
     # Update streak data for this game
     if gameName not in streaks:
@@ -217,9 +620,24 @@ def saveStreakData(gameName, winCount, maxStreak):
         streaks[gameName]["current_streak"] = winCount
         streaks[gameName]["max_streak"] = max(streaks[gameName]["max_streak"], maxStreak)
     
-    # Save updated data
-    with open(streakFile, 'w') as f:
-        json.dump(streaks, f)
+    _saveState(state)
+
+def flushStreakData():
+    """
+    Write pending win streak changes to disk.
+    
+    Streaks are saved together with the rest of the game state, so this
+    writes everything queued by flushPendingWrites. It is also called
+    automatically when the program exits.
+    
+    Returns:
+        None
+        
+    Examples:
+        >>> saveStreakData("roulette", 3, 5)
+        >>> flushStreakData()  # state.json now has the new streak
+    """
+    flushPendingWrites()
 
 def getStreakData(gameName):
     """
@@ -240,34 +658,14 @@ def getStreakData(gameName):
         >>> getStreakData("unknown_game")
         (0, 0)  # No data for this game
     """
-    dataDir = createDataDirectory()
-    streakFile = dataDir / "win_streaks.json"
-    
-    if not streakFile.exists():
+    entry = _loadState()["streaks"].get(gameName)
+    if not entry:
         return (0, 0)
-    
-    with open(streakFile, 'r') as f:
-        try:
-            streaks = json.load(f)
-            if gameName in streaks:
-                return (streaks[gameName]["current_streak"], streaks[gameName]["max_streak"])
-            else:
-                return (0, 0)
-        except (json.JSONDecodeError, KeyError):
-            return (0, 0)
+    return (entry.get("current_streak", 0), entry.get("max_streak", 0))
 
-def handleHelpCommand(gameName):
-    """
-    Display help information for a specific game.
-    
-    Args:
-        gameName (str): The name of the game to show help for
-        
-    Returns:
-        None: Just prints the help information
-    """
-    helpText = {
-        "general": """
+# Help text for each game; "general" is shown for games without their own
+_HELP_TEXT = {
+    "general": """
 === GENERAL COMMANDS ===
 help              - Display this help message
 quit, q, exit     - Exit the current game
@@ -279,7 +677,7 @@ statistics        - Show overall statistics across all games
 
 Special commands are available in each game. Type 'help' while playing for game-specific help.
 """,
-        "roulette": """
+    "roulette": """
 === ROULETTE COMMANDS ===
 help              - Display this help message
 quit, q, exit     - Exit the game
@@ -308,7 +706,7 @@ quick:low [amount]    - Quickly bet on low numbers (1-18)
 quick:high [amount]   - Quickly bet on high numbers (19-36)
 quick:0 [amount]      - Quickly bet on zero
 """,
-        "mastermind": """
+    "mastermind": """
 === MASTERMIND COMMANDS ===
 help              - Display this help message
 quit, q, exit     - Exit the game
@@ -322,7 +720,7 @@ Game Options:
 - Select game mode: standard (allows repeated digits) or no-repeats (unique digits in code only)
 - You can enter repeated digits in your guesses regardless of game mode
 """,
-        "blackjack": """
+    "blackjack": """
 === BLACKJACK COMMANDS ===
 help              - Display this help message
 quit, q, exit     - Exit the game
@@ -341,12 +739,40 @@ How to Win:
 - Dealer hits until they have 17 or more
 - Blackjack (Ace + 10-value card) pays 3:2
 """
-    }
+}
+
+@lru_cache(maxsize=32)
+def _coloredHelpText(topic, colorEnabled, rainbowMode):
+    """
+    Build the colored help message for a topic, ready to write.
     
-    if gameName.lower() in helpText:
-        print(colorText(helpText[gameName.lower()], "cyan"))
-    else:
-        print(colorText(helpText["general"], "cyan"))
+    The color settings are part of the cache key (colorText reads them from
+    the module globals), so toggling color or rainbow mode is respected.
+    
+    Args:
+        topic (str): A key of _HELP_TEXT
+        colorEnabled (bool): The current color setting
+        rainbowMode (bool): The current rainbow text setting
+        
+    Returns:
+        str: The colored help text followed by a newline
+    """
+    return colorText(_HELP_TEXT[topic], "cyan") + "\n"
+
+def handleHelpCommand(gameName):
+    """
+    Display help information for a specific game.
+    
+    Args:
+        gameName (str): The name of the game to show help for
+        
+    Returns:
+        None: Just prints the help information
+    """
+    topic = gameName.lower()
+    if topic not in _HELP_TEXT:
+        topic = "general"
+    sys.stdout.write(_coloredHelpText(topic, _colorEnabled, _rainbowTextMode))
 
 def processCheatCode(code):
     """
@@ -363,33 +789,35 @@ def processCheatCode(code):
     """
     global _rainbowTextMode, _debugMode, _tutorialMode
     
-    if code.lower() in CHEAT_CODES:
-        cheat = CHEAT_CODES[code.lower()]
-        action = cheat["action"]
-        value = cheat["value"]
-        
-        if action == "rocks":
-            # Add rocks to the player's balance
-            current_balance = getRockBalance()
-            new_balance = current_balance + value
-            updateRockBalance(new_balance)
-            return (True, colorText(f"Cheat code activated! Added {value} Rocks to your balance!", "green"))
-            
-        elif action == "rainbow":
-            # Toggle rainbow text mode
-            _rainbowTextMode = value
-            return (True, colorText("Cheat code activated! Rainbow text mode enabled!", "rainbow"))
-            
-        elif action == "debug":
-            # Toggle debug mode
-            _debugMode = value
-            return (True, colorText("Cheat code activated! Debug mode enabled!", "cyan"))
-            
-        elif action == "tutorial":
-            # Toggle tutorial mode
-            _tutorialMode = value
-            return (True, colorText("Cheat code activated! Tutorial mode enabled!", "yellow"))
-            
+    cheat = _CHEAT_CODES_LC.get(code.lower())
+    if cheat is None:
+        return (False, "")
+        
+    action = cheat["action"]
+    value = cheat["value"]
+    
+    if action == "rocks":
+        # Add rocks to the player's balance
+        current_balance = getRockBalance()
+        new_balance = current_balance + value
+        updateRockBalance(new_balance)
+        return (True, colorText(f"Cheat code activated! Added {value} Rocks to your balance!", "green"))
+        
+    elif action == "rainbow":
+        # Toggle rainbow text mode
+        _rainbowTextMode = value
+        return (True, colorText("Cheat code activated! Rainbow text mode enabled!", "rainbow"))
+        
+    elif action == "debug":
+        # Toggle debug mode
+        _debugMode = value
+        return (True, colorText("Cheat code activated! Debug mode enabled!", "cyan"))
+        
+    elif action == "tutorial":
+        # Toggle tutorial mode
+        _tutorialMode = value
+        return (True, colorText("Cheat code activated! Tutorial mode enabled!", "yellow"))
+        
     return (False, "")
 
 
@@ -413,6 +841,120 @@ def getTutorialMode():
     return _tutorialMode
 
 
+def _helpCommand(gameName):
+    """Handle the 'help' command."""
+    handleHelpCommand(gameName)
+    return (True, "help displayed")
+
+
+def _colorSwitchCommand(gameName):
+    """Handle the 'color:switch' command."""
+    newState = toggleColor()
+    if newState:
+        return (True, colorText("Color output is now ON", "green"))
+    else:
+        return (True, "Color output is now OFF")
+
+
+def _colorCommand(gameName):
+    """Handle the 'color' command."""
+    state = getColorState()
+    return (True, f"Color is currently: {'ON' if state else 'OFF'}")
+
+
+def _rocksCommand(gameName):
+    """Handle the 'rocks' and 'balance' commands."""
+    rocks = getRockBalance()
+    return (True, colorText(f"Your current rock balance: {rocks} Rocks", "cyan"))
+
+
+def _historyCommand(gameName):
+    """Handle the 'his' and 'history' commands (Roulette only)."""
+    if gameName.lower() != "roulette":
+        return (False, "")
+    displayRouletteSpinHistory()
+    return (True, "roulette history displayed")
+
+
+def _statsCommand(gameName):
+    """Handle the 'stats' command by showing stats for the current game."""
+    stats = _readGameStats(gameName)
+    print(colorText(f"\n=== {gameName.upper()} STATISTICS ===", "cyan"))
+    print(f"Total plays: {stats['plays']}")
+    print(f"Wins: {stats['wins']} ({int(stats['wins']/max(1, stats['plays'])*100)}%)")
+    print(f"Losses: {stats['losses']}")
+    print(f"Draws: {stats['draws']}")
+    print(f"Total Rocks won: {stats['rocks_won']}")
+    print(f"Total Rocks lost: {stats['rocks_lost']}")
+    print(f"Best win: {stats['best_win']} Rocks")
+    print(f"Worst loss: {stats['worst_loss']} Rocks")
+    if 'history' in stats and isinstance(stats['history'], list) and len(stats['history']) > 0:
+        print(colorText("\nRecent history:", "yellow"))
+        # Most recent first, without copying the history list
+        for i, entry in enumerate(islice(reversed(stats['history']), 5)):
+            result_color = "green" if entry['result'] == "win" else "red" if entry['result'] == "loss" else "yellow"
+            result_text = colorText(entry['result'].upper(), result_color)
+            print(f"  {i+1}. {result_text} - Rocks change: {entry['rocks_change']}")
+    return (True, "stats displayed")
+
+
+def _statisticsCommand(gameName):
+    """Handle the 'statistics' command by showing stats across all games."""
+    stats = _readGameStats()
+    print(colorText("\n=== OVERALL GAME STATISTICS ===", "cyan"))
+    print(f"Total plays across all games: {stats['total_plays']}")
+    print(f"Total wins: {stats['total_wins']} ({int(stats['total_wins']/max(1, stats['total_plays'])*100)}%)")
+    print(f"Total Rocks won: {stats['total_rocks_won']}")
+    print(f"Total Rocks lost: {stats['total_rocks_lost']}")
+    print(f"Net Rocks: {stats['total_rocks_won'] - stats['total_rocks_lost']}")
+    
+    # Show per-game summary (straight from the loaded state; the summary
+    # above has no per-game section)
+    all_games = _loadState()["stats"].get("games")
+    if all_games:
+        print(colorText("\nGame breakdown:", "yellow"))
+        for game, game_stats in all_games.items():
+            if game_stats["plays"] > 0:
+                win_rate = int(game_stats["wins"] / game_stats["plays"] * 100)
+                print(f"  {game}: {game_stats['plays']} plays, {win_rate}% win rate")
+    return (True, "stats displayed")
+
+
+def _resetCommand(gameName):
+    """Handle the 'reset' command."""
+    # Reset all games and data
+    if resetAllGames():
+        return (True, "reset complete")
+    return (True, "reset cancelled")
+
+
+def _cheatsCommand(gameName):
+    """Handle the 'cheats' command (debug mode only)."""
+    if not getDebugMode():
+        return (False, "")
+    # Display available cheat codes (only in debug mode)
+    print(colorText("\n=== AVAILABLE CHEAT CODES ===", "magenta"))
+    for code, info in CHEAT_CODES.items():
+        print(f"  {colorText(code, 'yellow')}: {info['description']}")
+    return (True, "cheat codes displayed")
+
+
+# General commands and the functions that handle them
+_COMMAND_TABLE = {
+    "help": _helpCommand,
+    "color:switch": _colorSwitchCommand,
+    "color": _colorCommand,
+    "rocks": _rocksCommand,
+    "balance": _rocksCommand,
+    "his": _historyCommand,
+    "history": _historyCommand,
+    "stats": _statsCommand,
+    "statistics": _statisticsCommand,
+    "reset": _resetCommand,
+    "cheats": _cheatsCommand,
+}
+
+
 def processCommand(command, gameName):
     """
     Process a common command across all games.
@@ -424,91 +966,50 @@ def processCommand(command, gameName):
     Returns:
         tuple: (bool, str) - (True if command was handled, result message)
     """
+    # Lowercase once; both cheat codes and commands are case-insensitive
+    command = command.lower()
+    
     # Check if this is a cheat code
     isCheat, cheatMessage = processCheatCode(command)
     if isCheat:
         return (True, cheatMessage)
     
-    if command.lower() in ["help"]:
-        handleHelpCommand(gameName)
-        return (True, "help displayed")
-        
-    if command.lower() == "color:switch":
-        newState = toggleColor()
-        if newState:
-            return (True, colorText("Color output is now ON", "green"))
-        else:
-            return (True, "Color output is now OFF")
-            
-    if command.lower() == "color":
-        state = getColorState()
-        return (True, f"Color is currently: {'ON' if state else 'OFF'}")
-    
-    if command.lower() in ["rocks", "balance"]:
-        rocks = getRockBalance()
-        return (True, colorText(f"Your current rock balance: {rocks} Rocks", "cyan"))
-    
-    # Roulette-specific commands
-    if gameName.lower() == "roulette" and command.lower() in ["his", "history"]:
-        displayRouletteSpinHistory()
-        return (True, "roulette history displayed")
-    
-    if command.lower() in ["stats", "statistics"]:
-        # Show game-specific stats or general stats
-        if command.lower() == "stats":
-            stats = getGameStats(gameName)
-            print(colorText(f"\n=== {gameName.upper()} STATISTICS ===", "cyan"))
-            print(f"Total plays: {stats['plays']}")
-            print(f"Wins: {stats['wins']} ({int(stats['wins']/max(1, stats['plays'])*100)}%)")
-            print(f"Losses: {stats['losses']}")
-            print(f"Draws: {stats['draws']}")
-            print(f"Total Rocks won: {stats['rocks_won']}")
-            print(f"Total Rocks lost: {stats['rocks_lost']}")
-            print(f"Best win: {stats['best_win']} Rocks")
-            print(f"Worst loss: {stats['worst_loss']} Rocks")
-            if 'history' in stats and isinstance(stats['history'], list) and len(stats['history']) > 0:
-                print(colorText("\nRecent history:", "yellow"))
-                for i, entry in enumerate(reversed(stats['history'][:5])):
-                    result_color = "green" if entry['result'] == "win" else "red" if entry['result'] == "loss" else "yellow"
-                    result_text = colorText(entry['result'].upper(), result_color)
-                    print(f"  {i+1}. {result_text} - Rocks change: {entry['rocks_change']}")
-        else:
-            # General stats across all games
-            stats = getGameStats()
-            print(colorText("\n=== OVERALL GAME STATISTICS ===", "cyan"))
-            print(f"Total plays across all games: {stats['total_plays']}")
-            print(f"Total wins: {stats['total_wins']} ({int(stats['total_wins']/max(1, stats['total_plays'])*100)}%)")
-            print(f"Total Rocks won: {stats['total_rocks_won']}")
-            print(f"Total Rocks lost: {stats['total_rocks_lost']}")
-            print(f"Net Rocks: {stats['total_rocks_won'] - stats['total_rocks_lost']}")
-            
-            # Show per-game summary
-            all_games = getGameStats(None)
-            if isinstance(all_games, dict) and "games" in all_games:
-                print(colorText("\nGame breakdown:", "yellow"))
-                for game, game_stats in all_games["games"].items():
-                    if game_stats["plays"] > 0:
-                        win_rate = int(game_stats["wins"] / game_stats["plays"] * 100)
-                        print(f"  {game}: {game_stats['plays']} plays, {win_rate}% win rate")
-        
-        return (True, "stats displayed")
-    
-    if command.lower() == "reset":
-        # Reset all games and data
-        if resetAllGames():
-            return (True, "reset complete")
-        return (True, "reset cancelled")
-        
-    if command.lower() == "cheats" and getDebugMode():
-        # Display available cheat codes (only in debug mode)
-        print(colorText("\n=== AVAILABLE CHEAT CODES ===", "magenta"))
-        for code, info in CHEAT_CODES.items():
-            print(f"  {colorText(code, 'yellow')}: {info['description']}")
-        return (True, "cheat codes displayed")
+    handler = _COMMAND_TABLE.get(command)
+    if handler:
+        return handler(gameName)
         
     # Command not handled by this function
     return (False, "")
 
+# Rewards for specific win streaks: streak -> (reward, message)
+_STREAK_REWARDS = {
+    3: (10, "Win Streak Bonus! +10 Rocks for 3 wins in a row!"),
+    5: (25, "Win Streak Bonus! +25 Rocks for 5 wins in a row!"),
+    10: (100, "AMAZING Win Streak! +100 Rocks for 10 consecutive wins!"),
+}
+
+@lru_cache(maxsize=128)
+def _streakReward(streak):
+    """
+    Look up the reward and (uncolored) message for a win streak.
+    
+    The result depends only on the streak, so it is cached; color is applied
+    by the caller because it can be toggled during a session.
+    
+    Args:
+        streak (int): The current win streak
+        
+    Returns:
+        tuple: (reward_amount, message) or None if the streak earns no reward
+    """
+    tier = _STREAK_REWARDS.get(streak)
+    if tier:
+        return tier
+    if streak > 0 and streak % 10 == 0:
+        reward = streak * 10
+        return (reward, f"LEGENDARY Win Streak! +{reward} Rocks for {streak} consecutive wins!")
+    return None
+
 def getWinStreakReward(streak, gameName):
     """
     Calculate reward for a win streak.
@@ -520,19 +1021,13 @@ def getWinStreakReward(streak, gameName):
     Returns:
         tuple: (reward_amount, message) or (0, "") if no reward
     """
-    # Base rewards
-    if streak == 3:
-        return (10, colorText(f"Win Streak Bonus! +10 Rocks for 3 wins in a row!", "green"))
-    elif streak == 5:
-        return (25, colorText(f"Win Streak Bonus! +25 Rocks for 5 wins in a row!", "green"))
-    elif streak == 10:
-        return (100, colorText(f"AMAZING Win Streak! +100 Rocks for 10 consecutive wins!", "green"))
-    elif streak > 0 and streak % 10 == 0:
-        reward = streak * 10
-        return (reward, colorText(f"LEGENDARY Win Streak! +{reward} Rocks for {streak} consecutive wins!", "green"))
+    tier = _streakReward(streak)
+    if tier is None:
+        # No reward
+        return (0, "")
         
-    # No reward
-    return (0, "")
+    reward, message = tier
+    return (reward, colorText(message, "green"))
     
 
 def getRockBalance():
@@ -553,21 +1048,7 @@ def getRockBalance():
         >>> getRockBalance()
         150  # Updated balance
     """
-    dataDir = createDataDirectory()
-    balanceFile = dataDir / "rocks_balance.json"
-    
-    if not balanceFile.exists():
-        # If no balance exists yet, create one with the default amount
-        updateRockBalance(DEFAULT_ROCKS)
-        return DEFAULT_ROCKS
-    
-    try:
-        with open(balanceFile, 'r') as f:
-            data = json.load(f)
-            return data.get("balance", DEFAULT_ROCKS)
-    except (json.JSONDecodeError, IOError):
-        # If there's an error reading the file, return the default
-        return DEFAULT_ROCKS
+    return _loadState().get("balance", DEFAULT_ROCKS)
 
 
 def updateRockBalance(newBalance):
@@ -575,7 +1056,8 @@ def updateRockBalance(newBalance):
     Update the player's rock balance.
     
     This function updates the shared rock balance that is used
-    across all games in the collection.
+    across all games in the collection. The new balance is visible to
+    getRockBalance immediately and written to disk by flushPendingWrites.
     
     Args:
         newBalance (int): The new rock balance
@@ -589,20 +1071,14 @@ def updateRockBalance(newBalance):
         >>> updateRockBalance(getRockBalance() + 50)
         200  # Added 50 rocks to current balance
     """
-    dataDir = createDataDirectory()
-    balanceFile = dataDir / "rocks_balance.json"
-    
     # Ensure balance is a positive integer
     newBalance = max(0, int(newBalance))
     
-    try:
-        data = {"balance": newBalance, "last_updated": datetime.now().isoformat()}
-        with open(balanceFile, 'w') as f:
-            json.dump(data, f)
-        return newBalance
-    except IOError:
-        print(colorText("Warning: Could not save rock balance.", "yellow"))
-        return newBalance
+    state = _loadState()
+    state["balance"] = newBalance
+    state["last_updated"] = datetime.now().isoformat()
+    _saveState(state)
+    return newBalance
 
 # Input prompt styling function
 def getInput(prompt):
@@ -644,17 +1120,10 @@ def saveGameState(gameName, state):
         >>> saveGameState("adventure", gameState)
         True
     """
-    dataDir = createDataDirectory()
-    saveDir = dataDir / "saved_games"
-    
-    # Create the saved_games directory if it doesn't exist
-    saveDir.mkdir(exist_ok=True)
-    
-    saveFile = saveDir / f"{gameName}_save.json"
+    saveFile = _SAVE_DIR / f"{gameName}_save.json"
     
     try:
-        with open(saveFile, 'w') as f:
-            json.dump(state, f)
+        _atomicWriteJson(saveFile, state)
         return True
     except IOError:
         print(colorText("Warning: Could not save game state.", "yellow"))
@@ -680,17 +1149,13 @@ def loadGameState(gameName):
         >>> loadGameState("nonexistent_game")
         None
     """
-    dataDir = createDataDirectory()
-    saveDir = dataDir / "saved_games"
-    saveFile = saveDir / f"{gameName}_save.json"
+    saveFile = _SAVE_DIR / f"{gameName}_save.json"
     
-    if not saveFile.exists():
-        return None
-        
     try:
-        with open(saveFile, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _jsonLoads(saveFile.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (ValueError, IOError):
         print(colorText("Warning: Could not load saved game.", "yellow"))
         return None
 
@@ -711,9 +1176,7 @@ def hasSavedGame(gameName):
         >>> hasSavedGame("nonexistent_game")
         False
     """
-    dataDir = createDataDirectory()
-    saveDir = dataDir / "saved_games"
-    saveFile = saveDir / f"{gameName}_save.json"
+    saveFile = _SAVE_DIR / f"{gameName}_save.json"
     
     return saveFile.exists()
 
@@ -732,16 +1195,13 @@ def deleteSavedGame(gameName):
         >>> deleteSavedGame("adventure")
         True
     """
-    dataDir = createDataDirectory()
-    saveDir = dataDir / "saved_games"
-    saveFile = saveDir / f"{gameName}_save.json"
+    saveFile = _SAVE_DIR / f"{gameName}_save.json"
     
-    if not saveFile.exists():
-        return True
-        
     try:
         saveFile.unlink()
         return True
+    except FileNotFoundError:
+        return True
     except IOError:
         print(colorText("Warning: Could not delete saved game.", "yellow"))
         return False
@@ -768,7 +1228,10 @@ def confirmQuit(gameName=None, state=None):
     if not gameName or not state:
         # Simple quit without save option if no game state is provided
         response = input(colorText("\nAre you sure you want to quit? (y/n): ", "yellow")).lower()
-        return response.startswith('y')
+        if response.startswith('y'):
+            flushPendingWrites()
+            return True
+        return False
     
     print(colorText("\nQuit options:", "cyan"))
     print("  (S) Save and quit")
@@ -782,12 +1245,14 @@ def confirmQuit(gameName=None, state=None):
             # Save game state before quitting
             if saveGameState(gameName, state):
                 print(colorText(f"Game saved! You can resume later by selecting {gameName}.", "green"))
+            flushPendingWrites()
             return True
             
         elif choice in ['q', 'quit']:
             # Quit without saving
             confirm = input(colorText("Are you sure you want to quit without saving? (y/n): ", "red")).lower()
             if confirm.startswith('y'):
+                flushPendingWrites()
                 return True
                 
         elif choice in ['c', 'cancel', 'n', 'no']:
@@ -818,41 +1283,33 @@ def resetAllGames():
         print(colorText("Reset cancelled.", "yellow"))
         return False
     
-    dataDir = createDataDirectory()
-    
     # Delete saved games
-    saveDir = dataDir / "saved_games"
-    if saveDir.exists():
-        try:
-            for saveFile in saveDir.glob("*_save.json"):
-                saveFile.unlink()
-            saveDir.rmdir()
-        except IOError:
-            print(colorText("Warning: Could not delete all saved games.", "yellow"))
-    
-    # Delete rock balance
-    balanceFile = dataDir / "rocks_balance.json"
-    if balanceFile.exists():
-        try:
-            balanceFile.unlink()
-        except IOError:
-            print(colorText("Warning: Could not delete rock balance.", "yellow"))
-    
-    # Delete statistics
-    statsFile = dataDir / "game_stats.json"
-    if statsFile.exists():
-        try:
-            statsFile.unlink()
-        except IOError:
-            print(colorText("Warning: Could not delete game statistics.", "yellow"))
-    
-    # Delete streak data
-    streakFile = dataDir / "win_streaks.json"
-    if streakFile.exists():
+    try:
+        for entry in _SAVE_DIR.iterdir():
+            if entry.name.endswith("_save.json"):
+                entry.unlink()
+        _SAVE_DIR.rmdir()
+    except FileNotFoundError:
+        pass  # No games have been saved
+    except IOError:
+        print(colorText("Warning: Could not delete all saved games.", "yellow"))
+    
+    # Drop queued writes so they can't recreate the deleted files
+    _pendingWrites.clear()
+    
+    # Delete rock balance, streaks and statistics, including the older
+    # separate save files so they aren't migrated back, their retired
+    # ".migrated" copies and any state files set aside as corrupt
+    for dataFile in (_STATE_FILE, *_DATA_DIR.glob(_STATE_FILE.name + ".corrupt-*"),
+                     _BALANCE_FILE, _STATS_FILE, _STREAK_FILE,
+                     *(path.with_name(path.name + ".migrated")
+                       for path in (_BALANCE_FILE, _STATS_FILE, _STREAK_FILE))):
         try:
-            streakFile.unlink()
+            dataFile.unlink()
+        except FileNotFoundError:
+            pass
         except IOError:
-            print(colorText("Warning: Could not delete streak data.", "yellow"))
+            print(colorText(f"Warning: Could not delete {dataFile.name}.", "yellow"))
     
     print(colorText("\nAll game data has been reset!", "green"))
     print("The program will now restart for changes to take effect...")
@@ -862,12 +1319,34 @@ def resetAllGames():
     return True
 
 # Game statistics tracking functions
+def _newGameStats():
+    """
+    Create the statistics record for a game that hasn't been played yet.
+    
+    Returns:
+        dict: Zeroed statistics with an empty history
+    """
+    return {
+        "plays": 0,
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+        "rocks_won": 0,
+        "rocks_lost": 0,
+        "best_win": 0,
+        "worst_loss": 0,
+        "top_wins": [],  # Min-heap of the largest wins, at most _TOP_WINS long
+        "last_played": "",
+        "history": []
+    }
+
 def saveGameStats(gameName, result, rocksWon=0, details=None):
     """
     Save game statistics for tracking performance.
     
     This function records the outcome of a game along with any
-    details for long-term statistics tracking.
+    details for long-term statistics tracking. The updated statistics are
+    written to disk by flushPendingWrites.
     
     Args:
         gameName (str): The name of the game played
@@ -876,7 +1355,7 @@ def saveGameStats(gameName, result, rocksWon=0, details=None):
         details (dict, optional): Additional details about the game
         
     Returns:
-        bool: True if statistics were saved successfully, False otherwise
+        bool: True once the statistics have been recorded
         
     Examples:
         >>> saveGameStats('roulette', 'win', 25, {'bet_type': 'red'})
@@ -884,46 +1363,34 @@ def saveGameStats(gameName, result, rocksWon=0, details=None):
         >>> saveGameStats('blackjack', 'loss', -10)
         True
     """
-    dataDir = createDataDirectory()
-    statsFile = dataDir / "game_stats.json"
-    
-    # Initialize or load existing stats
-    if statsFile.exists():
-        try:
-            with open(statsFile, 'r') as f:
-                stats = json.load(f)
-        except json.JSONDecodeError:
-            stats = {"games": {}}
-    else:
-        stats = {"games": {}}
+    # Load existing stats
+    state = _loadState()
+    stats = state["stats"]
     
     # Initialize game entry if it doesn't exist
-    if gameName not in stats["games"]:
-        stats["games"][gameName] = {
-            "plays": 0,
-            "wins": 0,
-            "losses": 0,
-            "draws": 0,
-            "rocks_won": 0,
-            "rocks_lost": 0,
-            "best_win": 0,
-            "worst_loss": 0,
-            "last_played": "",
-            "history": []
-        }
+    game_stats = stats["games"].get(gameName)
+    if game_stats is None:
+        game_stats = stats["games"][gameName] = _newGameStats()
     
     # Update game statistics
-    game_stats = stats["games"][gameName]
     game_stats["plays"] += 1
     
     if result == "win":
         game_stats["wins"] += 1
         game_stats["rocks_won"] += rocksWon
-        game_stats["best_win"] = max(game_stats["best_win"], rocksWon)
+        if rocksWon > game_stats["best_win"]:
+            game_stats["best_win"] = rocksWon
+        top_wins = game_stats.setdefault("top_wins", [])
+        if len(top_wins) < _TOP_WINS:
+            heapq.heappush(top_wins, rocksWon)
+        elif rocksWon > top_wins[0]:
+            heapq.heapreplace(top_wins, rocksWon)
     elif result == "loss":
+        loss_amount = -rocksWon if rocksWon < 0 else 0
         game_stats["losses"] += 1
-        game_stats["rocks_lost"] += abs(rocksWon) if rocksWon < 0 else 0
-        game_stats["worst_loss"] = max(game_stats["worst_loss"], abs(rocksWon) if rocksWon < 0 else 0)
+        game_stats["rocks_lost"] += loss_amount
+        if loss_amount > game_stats["worst_loss"]:
+            game_stats["worst_loss"] = loss_amount
     elif result == "draw":
         game_stats["draws"] += 1
     
@@ -941,8 +1408,10 @@ def saveGameStats(gameName, result, rocksWon=0, details=None):
     if details:
         history_entry["details"] = details
         
-    game_stats["history"].append(history_entry)
-    game_stats["history"] = game_stats["history"][-50:]  # Keep last 50 entries
+    history = game_stats["history"]
+    history.append(history_entry)
+    if len(history) > 50:
+        del history[:-50]  # Keep last 50 entries, trimming in place
     
     # Update the global stats
     if "summary" not in stats:
@@ -961,13 +1430,33 @@ def saveGameStats(gameName, result, rocksWon=0, details=None):
         stats["summary"]["total_rocks_lost"] += abs(rocksWon)
     
     # Save updated stats
-    try:
-        with open(statsFile, 'w') as f:
-            json.dump(stats, f, indent=2)
-        return True
-    except IOError:
-        print(colorText("Warning: Could not save game statistics.", "yellow"))
-        return False
+    _saveState(state)
+    return True
+
+
+def _readGameStats(gameName=None):
+    """
+    Get the live statistics for a game, or the summary for all games.
+    
+    The returned dict is shared with the state cache, so callers must not
+    modify it; see getGameStats for the arguments.
+    """
+    stats = _loadState()["stats"]
+    
+    if gameName:
+        # Return stats for specific game (or empty stats if game not found)
+        gameStats = stats.get("games", {}).get(gameName)
+        if gameStats is None:
+            gameStats = _newGameStats()
+        return gameStats
+        
+    # Return summary stats for all games
+    return stats.get("summary", {
+        "total_plays": 0,
+        "total_wins": 0,
+        "total_rocks_won": 0,
+        "total_rocks_lost": 0
+    })
 
 
 def getGameStats(gameName=None):
@@ -976,6 +1465,7 @@ def getGameStats(gameName=None):
     
     This function retrieves the saved statistics for a game
     or a summary of all games if no game name is provided.
+    The result is a copy: changing it does not change the saved statistics.
     
     Args:
         gameName (str, optional): The name of the game to get stats for,
@@ -990,132 +1480,91 @@ def getGameStats(gameName=None):
         >>> getGameStats()
         {'total_plays': 25, 'total_wins': 12, 'total_rocks_won': 250, ...}
     """
-    dataDir = createDataDirectory()
-    statsFile = dataDir / "game_stats.json"
-    
-    if not statsFile.exists():
-        # No stats saved yet
-        if gameName:
-            return {
-                "plays": 0,
-                "wins": 0,
-                "losses": 0,
-                "draws": 0,
-                "rocks_won": 0,
-                "rocks_lost": 0,
-                "best_win": 0,
-                "worst_loss": 0,
-                "last_played": "",
-                "history": []
-            }
-        else:
-            return {
-                "total_plays": 0,
-                "total_wins": 0,
-                "total_rocks_won": 0,
-                "total_rocks_lost": 0
-            }
+    return copy.deepcopy(_readGameStats(gameName))
+
+
+def dumpStatsPretty(gameName=None):
+    """
+    Format saved game statistics as indented JSON for reading.
     
-    try:
-        with open(statsFile, 'r') as f:
-            stats = json.load(f)
-            
-        if gameName:
-            # Return stats for specific game (or empty stats if game not found)
-            return stats["games"].get(gameName, {
-                "plays": 0,
-                "wins": 0,
-                "losses": 0,
-                "draws": 0,
-                "rocks_won": 0,
-                "rocks_lost": 0,
-                "best_win": 0,
-                "worst_loss": 0,
-                "last_played": "",
-                "history": []
-            })
-        else:
-            # Return summary stats for all games
-            return stats.get("summary", {
-                "total_plays": 0,
-                "total_wins": 0,
-                "total_rocks_won": 0,
-                "total_rocks_lost": 0
-            })
-            
-    except (json.JSONDecodeError, KeyError, IOError):
-        # If there's an error reading the file, return empty stats
-        return {
-            "plays": 0,
-            "wins": 0,
-            "losses": 0,
-            "draws": 0,
-            "rocks_won": 0,
-            "rocks_lost": 0
-        } if gameName else {
-            "total_plays": 0,
-            "total_wins": 0,
-            "total_rocks_won": 0,
-            "total_rocks_lost": 0
+    The statistics are stored as compact JSON; this function produces a
+    readable version for inspecting them by hand.
+    
+    Args:
+        gameName (str, optional): Only include the stats for this game,
+                                 or None to include all statistics
+        
+    Returns:
+        str: The statistics as indented JSON text
+        
+    Examples:
+        >>> print(dumpStatsPretty('roulette'))
+        {
+          "plays": 10,
+          "wins": 5,
+          ...
         }
+    """
+    stats = _readGameStats(gameName) if gameName else _loadState()["stats"]
+    return _jsonDumps(stats, indent=2).decode()
 
 
 # Quick betting presets for Roulette
+# (the templates are read-only; processQuickBet builds a QuickBet from them)
 ROULETTE_QUICK_BETS = {
-    "quick:red": {"type": "red", "description": "Red bet"},
-    "quick:black": {"type": "black", "description": "Black bet"},
-    "quick:odd": {"type": "odd", "description": "Odd numbers bet"},
-    "quick:even": {"type": "even", "description": "Even numbers bet"},
-    "quick:low": {"type": "low", "description": "Low numbers (1-18) bet"},
-    "quick:high": {"type": "high", "description": "High numbers (19-36) bet"},
-    "quick:0": {"type": "straight", "value": 0, "description": "Straight Up bet on 0"},
+    "quick:red": MappingProxyType({"type": "red", "description": "Red bet"}),
+    "quick:black": MappingProxyType({"type": "black", "description": "Black bet"}),
+    "quick:odd": MappingProxyType({"type": "odd", "description": "Odd numbers bet"}),
+    "quick:even": MappingProxyType({"type": "even", "description": "Even numbers bet"}),
+    "quick:low": MappingProxyType({"type": "low", "description": "Low numbers (1-18) bet"}),
+    "quick:high": MappingProxyType({"type": "high", "description": "High numbers (19-36) bet"}),
+    "quick:0": MappingProxyType({"type": "straight", "value": 0, "description": "Straight Up bet on 0"}),
 }
 
+# Quick bet templates keyed by the bet name after the "quick:" prefix
+_QUICK_NAMES = {key.partition(":")[2]: template for key, template in ROULETTE_QUICK_BETS.items()}
+
+# Parsed quick bet returned by processQuickBet. "value" is None for bets that
+# need no number, "amount" is None when no amount was given, "percentage" is
+# the requested percentage of the balance for percentage bets (else None),
+# "additional_bets" holds the QuickBets that followed a ";" and "error"
+# explains a rejected bet.
+QuickBet = namedtuple(
+    "QuickBet",
+    "type description value amount is_percentage percentage additional_bets error",
+)
+
 def saveRouletteSpinHistory(spinNumber, spinType):
     """
     Save the result of a roulette spin to history.
     
     This function saves the last spins in a roulette game to a JSON file
-    for displaying the history of results.
+    for displaying the history of results. The file is written by
+    flushPendingWrites.
     
     Args:
         spinNumber (int): The number that was spun
-        spinType (str): The type of the spin (red, black, green)
+        spinType (str): The type of the spin (red, black, green); stored lowercase
         
     Returns:
-        list: The updated history list
+        list: A copy of the updated history list, like getRouletteSpinHistory
         
     Examples:
         >>> saveRouletteSpinHistory(7, "red")
         [{'number': 7, 'type': 'red'}, ...]  # List of recent spins
     """
-    dataDir = createDataDirectory()
-    historyFile = dataDir / "roulette_history.json"
-    
-    # Initialize or load existing history
-    if historyFile.exists():
-        try:
-            with open(historyFile, 'r') as f:
-                history = json.load(f)
-        except json.JSONDecodeError:
-            history = []
-    else:
-        history = []
+    history = _readJsonCached(_HISTORY_FILE, [])
     
     # Add the new spin to history
-    history.append({"number": spinNumber, "type": spinType, "timestamp": datetime.now().isoformat()})
+    history.append({"number": spinNumber, "type": spinType.lower(), "timestamp": datetime.now().isoformat()})
     
-    # Keep only last 50 spins
-    history = history[-50:]
+    # Keep only last 50 spins, trimming in place
+    if len(history) > 50:
+        del history[:-50]
     
-    # Save updated history
-    try:
-        with open(historyFile, 'w') as f:
-            json.dump(history, f)
-        return history
-    except IOError:
-        print(colorText("Warning: Could not save roulette history.", "yellow"))
-        return history
+    # Queue the updated history to be saved
+    _scheduleJsonWrite(_HISTORY_FILE, history, "roulette history")
+    return copy.deepcopy(history)
 
 
 def getRouletteSpinHistory():
@@ -1123,25 +1572,31 @@ def getRouletteSpinHistory():
     Get the history of roulette spins.
     
     This function retrieves the saved history of roulette spins from a JSON file.
+    The parsed list is cached in memory, so the file is only read again after it
+    changes on disk. The result is a copy: changing it does not change the
+    saved history.
     
     Returns:
-        list: List of recent spins, or empty list if no history exists
+        list: List of recent spins, oldest first, or empty list if no history exists
         
     Examples:
         >>> getRouletteSpinHistory()
         [{'number': 7, 'type': 'red'}, {'number': 0, 'type': 'green'}, ...]
     """
-    dataDir = createDataDirectory()
-    historyFile = dataDir / "roulette_history.json"
-    
-    if not historyFile.exists():
-        return []
+    return copy.deepcopy(_readJsonCached(_HISTORY_FILE, []))
+
+
+def _spinType(spin):
+    """
+    Get the lowercase type of a spin history entry.
     
-    try:
-        with open(historyFile, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
+    New entries are stored lowercase; only entries from older history
+    files need to be lowercased here.
+    """
+    spinType = spin["type"]
+    if spinType in _SPIN_NUMBER_COLORS:
+        return spinType
+    return spinType.lower()
 
 
 def displayRouletteSpinHistory():
@@ -1162,7 +1617,8 @@ def displayRouletteSpinHistory():
         3. 26 (BLACK)
         ...
     """
-    history = getRouletteSpinHistory()
+    # Read the cached list directly; it is only displayed, never modified
+    history = _readJsonCached(_HISTORY_FILE, [])
     
     if not history:
         print(colorText("No spin history available yet.", "yellow"))
@@ -1170,18 +1626,14 @@ def displayRouletteSpinHistory():
     
     print(colorText("\n=== ROULETTE SPIN HISTORY ===", "cyan"))
     
-    # Display the most recent spins first
-    for i, spin in enumerate(reversed(history[:20])):
+    # Display the 20 most recent spins, newest first, straight from the cached list
+    for i, spin in enumerate(islice(reversed(history), 20)):
         number = spin["number"]
-        spinType = spin["type"].lower()
-        
-        # Determine color for the number
-        if spinType == "red":
-            numColor = "red"
-        elif spinType == "black":
-            numColor = "white"  # Use white on black terminal for visibility
-        else:  # green (0)
-            numColor = "green"
+        spinType = _spinType(spin)
+        if 0 <= number <= 36:
+            numColor = _ROULETTE_NUMBER_COLORS[number]
+        else:
+            numColor = _SPIN_NUMBER_COLORS.get(spinType, "green")
         
         # Format and display the spin
         typeText = spinType.upper()
@@ -1192,15 +1644,17 @@ def displayRouletteSpinHistory():
     if len(history) > 20:
         print(f"... and {len(history) - 20} more spins")
     
-    # Display some stats
-    red_count = sum(1 for spin in history if spin["type"].lower() == "red")
-    black_count = sum(1 for spin in history if spin["type"].lower() == "black")
-    green_count = sum(1 for spin in history if spin["type"].lower() == "green")
+    # Display some stats, counting all three colors in a single pass
+    counts = {"red": 0, "black": 0, "green": 0}
+    for spin in history:
+        spinType = _spinType(spin)
+        if spinType in counts:
+            counts[spinType] += 1
     
     print(colorText("\nStats from last 50 spins:", "yellow"))
-    print(f"Red: {red_count} ({int(red_count/len(history)*100)}%)")
-    print(f"Black: {black_count} ({int(black_count/len(history)*100)}%)")
-    print(f"Green: {green_count} ({int(green_count/len(history)*100)}%)")
+    print(f"Red: {counts['red']} ({int(counts['red']/len(history)*100)}%)")
+    print(f"Black: {counts['black']} ({int(counts['black']/len(history)*100)}%)")
+    print(f"Green: {counts['green']} ({int(counts['green']/len(history)*100)}%)")
     
     return True
 
@@ -1209,107 +1663,158 @@ def processQuickBet(command, current_balance=None):
     """
     Process a quick bet command for Roulette.
     
+    Parsing is memoized on the lowercased command and the balance, so the
+    returned QuickBet records are shared between calls; being namedtuples
+    they are immutable.
+    
     Args:
         command (str): The command entered by the user
         current_balance (int, optional): Current rock balance for percentage betting
         
     Returns:
-        tuple: (bool, dict) - (True if it's a valid quick bet, bet information)
+        tuple: (bool, QuickBet or None) - (True if it's a valid quick bet, bet information).
+            Rejected quick bets return (False, QuickBet) with only "error" set;
+            anything that is not a quick bet returns (False, None).
         
     Examples:
         >>> processQuickBet("quick:red 50")
-        (True, {'type': 'red', 'description': 'Red bet', 'amount': 50})
-        >>> processQuickBet("quick:red 50%", 200)
-        (True, {'type': 'red', 'description': 'Red bet', 'amount': 100})
-        >>> processQuickBet("quick:red 50%;black 30%", 200)
-        (True, {'type': 'red', 'description': 'Red bet', 'amount': 100, 'additional_bets': [{'type': 'black', 'description': 'Black bet', 'amount': 60}]})
+        (True, QuickBet(type='red', description='Red bet', value=None, amount=50, is_percentage=False, percentage=None, additional_bets=(), error=None))
+        >>> processQuickBet("quick:red 50%", 200)[1].amount
+        100
+        >>> processQuickBet("quick:red 150%", 200)[1].error
+        'Percentage must be between 0 and 100'
         >>> processQuickBet("invalid")
-        (False, {})
+        (False, None)
+    """
+    # Every quick bet starts with "quick:", so other input (menu choices,
+    # commands) is rejected without lowercasing it or filling the cache
+    if command.lstrip()[:6].lower() != "quick:":
+        return (False, None)
+        
+    return _parseQuickBet(command.lower(), current_balance)
+
+
+def _quickBetError(message):
+    """Build the QuickBet returned for a rejected quick bet."""
+    return QuickBet(None, None, None, None, False, None, (), message)
+
+
+@lru_cache(maxsize=512)
+def _parseQuickBet(command, current_balance):
     """
-    # Check for multiple bets separated by semicolons (e.g., "quick:red 50%;black 30%")
-    if ";" in command:
-        commands = command.split(";")
-        first_command = commands[0].strip()
+    Memoized kernel of processQuickBet; expects an already lowercased command.
+    
+    Args:
+        command (str): The lowercased quick bet command
+        current_balance (int or None): Current rock balance for percentage betting
         
-        # Process first command as normal
-        is_quick_bet, bet_info = processQuickBet(first_command, current_balance)
-        if not is_quick_bet:
-            return (False, {})
+    Returns:
+        tuple: (bool, QuickBet or None) - see processQuickBet
+    """
+    # Multiple bets are separated by semicolons (e.g., "quick:red 50%;black 30%");
+    # split once and parse each segment, starting with the first
+    segments = command.split(";")
+    is_quick_bet, bet_info = _parseSingleQuickBet(segments[0].strip(), current_balance)
+    if len(segments) == 1:
+        return (is_quick_bet, bet_info)
+    if not is_quick_bet:
+        return (False, None)
+        
+    # Process additional bets
+    additional_bets = []
+    remaining_balance = current_balance
+    if remaining_balance is not None and bet_info.amount is not None:
+        remaining_balance -= bet_info.amount
+    
+    for segment in segments[1:]:
+        segment = segment.strip()
+        if not segment:
+            continue
             
-        # Process additional bets
-        additional_bets = []
-        remaining_balance = current_balance - bet_info["amount"] if current_balance is not None else None
-        
-        for additional_command in commands[1:]:
-            additional_command = additional_command.strip()
-            if not additional_command:
-                continue
-                
-            # For additional bets, prepend "quick:" if not already present
-            if not additional_command.startswith("quick:"):
-                additional_command = "quick:" + additional_command
-                
-            is_quick_bet_additional, additional_bet_info = processQuickBet(additional_command, remaining_balance)
-            if is_quick_bet_additional:
-                additional_bets.append(additional_bet_info)
-                if remaining_balance is not None and "amount" in additional_bet_info:
-                    remaining_balance -= additional_bet_info["amount"]
-        
-        # Add the additional bets to the first bet info
-        if additional_bets:
-            bet_info["additional_bets"] = additional_bets
+        # For additional bets, prepend "quick:" if not already present
+        if not segment.startswith("quick:"):
+            segment = "quick:" + segment
+            
+        is_quick_bet_additional, additional_bet_info = _parseSingleQuickBet(segment, remaining_balance)
+        if not is_quick_bet_additional:
+            continue
+        if additional_bet_info.amount is None:
+            # Only the first bet can have its amount asked for afterwards
+            return (False, _quickBetError("Each additional bet needs an amount (e.g. quick:red 10;black 10)"))
             
-        return (True, bet_info)
+        additional_bets.append(additional_bet_info)
+        if remaining_balance is not None:
+            remaining_balance -= additional_bet_info.amount
     
-    # Standard single bet processing
-    parts = command.lower().split()
+    # Attach the additional bets to a copy of the first bet
+    if additional_bets:
+        bet_info = bet_info._replace(additional_bets=tuple(additional_bets))
+        
+    return (True, bet_info)
+
+
+def _parseSingleQuickBet(command, current_balance):
+    """
+    Parse one lowercased "quick:<name> [amount]" segment of a quick bet command.
     
-    if not parts:
-        return (False, {})
+    Args:
+        command (str): A single lowercased quick bet, without semicolons
+        current_balance (int or None): Rock balance for percentage betting
         
-    # Check if this is a quick bet command
-    quickBetType = parts[0]
-    if not quickBetType.startswith("quick:"):
-        return (False, {})
+    Returns:
+        tuple: (bool, QuickBet or None) - see processQuickBet
+    """
+    # Standard single bet processing: "quick:<name> [amount]"
+    head, _, rest = command.partition(":")
+    if head.strip() != "quick":
+        return (False, None)
         
-    bet_type = quickBetType.split(":", 1)[1]
-    if bet_type not in ROULETTE_QUICK_BETS:
-        return (False, {})
+    parts = rest.split()
+    if not parts:
+        return (False, None)
+        
+    # Single hash lookup on the bet name
+    bet_template = _QUICK_NAMES.get(parts[0])
+    if bet_template is None:
+        return (False, None)
         
     # Get bet amount if provided
     betAmount = None
+    percentage = None
     if len(parts) > 1:
-        try:
-            bet_amount_str = parts[1]
-            
-            # Check if it's a percentage bet
-            if bet_amount_str.endswith("%"):
-                if current_balance is None:
-                    return (False, {"error": "Percentage betting requires current balance"})
-                    
-                # Convert percentage to actual amount
+        bet_amount_str = parts[1]
+        
+        # Check if it's a percentage bet
+        if bet_amount_str.endswith("%"):
+            if current_balance is None:
+                return (False, _quickBetError("Percentage betting requires current balance"))
+                
+            # Convert percentage to actual amount
+            try:
                 percentage = float(bet_amount_str.rstrip("%"))
                 if percentage <= 0 or percentage > 100:
-                    return (False, {"error": "Percentage must be between 0 and 100"})
+                    return (False, _quickBetError("Percentage must be between 0 and 100"))
                     
                 betAmount = int(current_balance * percentage / 100)
-            else:
-                # Regular amount bet
-                betAmount = int(bet_amount_str)
-                
-            if betAmount <= 0:
-                return (False, {})
-        except ValueError:
-            return (False, {})
+            except ValueError:
+                return (False, None)
+        elif bet_amount_str.isdecimal():
+            # Regular amount bet; plain digits never make int() raise
+            betAmount = int(bet_amount_str)
+        else:
+            return (False, None)
             
-    # Return the quick bet information
-    bet_info = ROULETTE_QUICK_BETS[bet_type].copy()
-    bet_info["amount"] = betAmount
-    
-    # Add flag to indicate if this was a percentage bet
-    if len(parts) > 1 and betAmount is not None:
-        bet_info["is_percentage"] = "%" in parts[1]
-    else:
-        bet_info["is_percentage"] = False
-    
-    return (True, bet_info)
\ No newline at end of file
+        if betAmount <= 0:
+            return (False, None)
+            
+    # Return the quick bet information, flagging whether this was a percentage bet
+    return (True, QuickBet(
+        bet_template["type"],
+        bet_template["description"],
+        bet_template.get("value"),
+        betAmount,
+        percentage is not None,
+        percentage,
+        (),
+        None,
+    ))